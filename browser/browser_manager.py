@@ -1,4 +1,5 @@
 from browser.simpletextbrowser import SimpleTextBrowser
+from collections import OrderedDict
 from dotenv import load_dotenv
 from utils.helpers import WORK_FOLDER
 import time
@@ -10,11 +11,14 @@ BROWSER_TTL_SECONDS = 1800
 
 class BrowserManager:
     def __init__(self):
-        self.browsers = {}
+        self.browsers = OrderedDict()  # least recently used first
+        self._last_access = {}
 
     def get_browser(self, project_dir):
-        self._cleanup_stale()
-        if project_dir not in self.browsers:
+        now = time.monotonic()
+        browser = self.browsers.get(project_dir)
+        if browser is None:
+            self._cleanup_stale(now)
             default_request_kwargs = {
                 "timeout": (10, 10),
                 "headers": {
@@ -25,7 +29,7 @@ class BrowserManager:
                     )
                 },
             }
-            self.browsers[project_dir] = SimpleTextBrowser(
+            browser = SimpleTextBrowser(
                 start_page="about:blank",
                 viewport_size=1024 * 8,
                 downloads_folder=os.path.join(WORK_FOLDER, project_dir),
@@ -33,15 +37,17 @@ class BrowserManager:
                 request_kwargs=default_request_kwargs,
                 project_dir=project_dir,
             )
-        return self.browsers[project_dir]
+            self.browsers[project_dir] = browser
+        else:
+            self.browsers.move_to_end(project_dir)
+        self._last_access[project_dir] = now
+        return browser
 
-    def _cleanup_stale(self):
-        """Remove browsers idle longer than TTL"""
-        now = time.time()
-        stale = [
-            uid
-            for uid, browser in self.browsers.items()
-            if browser.history and (now - browser.history[-1][1]) > BROWSER_TTL_SECONDS
-        ]
-        for uid in stale:
+    def _cleanup_stale(self, now):
+        """Evict browsers idle longer than TTL, oldest first — stops at the first fresh one"""
+        while self.browsers:
+            uid = next(iter(self.browsers))
+            if now - self._last_access[uid] <= BROWSER_TTL_SECONDS:
+                break
             del self.browsers[uid]
+            del self._last_access[uid]
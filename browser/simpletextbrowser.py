@@ -47,6 +47,8 @@ class SimpleTextBrowser:
         self._find_on_page_last_result: Union[int, None] = (
             None  # Location of the last result
         )
+        # ((header, viewport page, page content), formatted_state text)
+        self._formatted_cache: Optional[Tuple[tuple, str]] = None
 
     @property
     def address(self) -> str:
@@ -445,3 +447,19 @@ class SimpleTextBrowser:
             f"Viewport position: Showing page {current_page + 1} of {total_pages}.\n"
         )
         return (header, self.viewport)
+
+    def formatted_state(self) -> str:
+        """Header and current viewport as one tool-ready string.
+
+        The joined string is reused while the header and viewport are unchanged
+        (repeat probes on the same page), so large viewports aren't re-copied.
+        """
+        header, content = self._state()
+        # Holding page_content keeps the identity check sound across navigations
+        key = (header, self.viewport_current_page, self._page_content)
+        cached = self._formatted_cache
+        if cached is not None and cached[0][:2] == key[:2] and cached[0][2] is key[2]:
+            return cached[1]
+        text = "".join((header.strip(), "\n=======================\n", content))
+        self._formatted_cache = (key, text)
+        return text
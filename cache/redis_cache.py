@@ -1,7 +1,9 @@
 import time
 import threading
 import os
-from typing import Dict, Optional, Any
+import random
+from itertools import islice
+from typing import Dict, List, Optional, Any
 
 
 class RedisStateManager:
@@ -10,146 +12,135 @@ class RedisStateManager:
     Maintains same interface as RedisStateManager for drop-in replacement.
     Shared state across all instances via class variables.
     """
-    # Class variables shared across all instances
-    _store: Dict[str, Dict[str, Any]] = {}
-    _lock = threading.RLock()  # Reentrant lock for thread safety
-    _cleanup_running = False
+    # Class variables shared across all instances.
+    # Store is split into shards so unrelated keys don't contend on one mutex.
+    SHARD_COUNT = 16  # must be a power of two
+    _shards: List[Dict[str, Dict[str, Any]]] = [{} for _ in range(SHARD_COUNT)]
+    _locks: List[threading.Lock] = [threading.Lock() for _ in range(SHARD_COUNT)]
+
+    # Expiry is lazy (checked on _get); writes occasionally sweep a small sample
+    EXPIRE_SWEEP_ODDS = 128
+    EXPIRE_SAMPLE_SIZE = 20
 
     def __init__(self):
         self.app_name = os.getenv("REDIS_APP_KEY", "micro_cc")
 
     def _make_key(self, key_type: str, *parts: str) -> str:
         """Generate namespaced key"""
+        if len(parts) == 1:  # every caller passes just project_dir
+            return f"{self.app_name}:{key_type}:{parts[0]}"
         return f"{self.app_name}:{key_type}:" + ":".join(parts)
 
+    def _shard_idx(self, key: str) -> int:
+        """Shard on the trailing key part (project_dir) so a project's keys share a shard."""
+        return hash(key.rpartition(":")[2]) & (self.SHARD_COUNT - 1)
+
     def _set_with_ttl(self, key: str, value: Any, ttl: int):
         """Set value with expiration timestamp"""
-        expiry = time.time() + ttl
-        with self._lock:
-            self._store[key] = {"value": value, "expiry": expiry}
+        now = time.monotonic()
+        idx = self._shard_idx(key)
+        shard = self._shards[idx]
+        with self._locks[idx]:
+            shard[key] = {"value": value, "expiry": now + ttl}
+            if random.randrange(self.EXPIRE_SWEEP_ODDS) == 0:
+                self._sweep_sample(shard, now)
+
+    def _sweep_sample(self, shard: Dict[str, Dict[str, Any]], now: float):
+        """Drop expired entries among the oldest EXPIRE_SAMPLE_SIZE. Caller holds the shard lock.
+
+        Live entries are moved to the back, so repeated sweeps rotate through the shard.
+        """
+        for k in list(islice(shard, self.EXPIRE_SAMPLE_SIZE)):
+            entry = shard.pop(k)
+            if now <= entry["expiry"]:
+                shard[k] = entry
+
+    @staticmethod
+    def _get_locked(shard: Dict[str, Dict[str, Any]], key: str, now: float) -> Optional[Any]:
+        """Read from shard, dropping the entry if expired. Caller holds the shard lock."""
+        entry = shard.get(key)
+        if entry is None:
+            return None
+        if now > entry["expiry"]:
+            del shard[key]
+            return None
+        return entry["value"]
 
     def _get(self, key: str) -> Optional[Any]:
         """Get value if not expired, cleanup if expired"""
-        with self._lock:
-            if key not in self._store:
-                return None
-            entry = self._store[key]
-            if time.time() > entry["expiry"]:
-                del self._store[key]
-                return None
-            return entry["value"]
+        idx = self._shard_idx(key)
+        with self._locks[idx]:
+            return self._get_locked(self._shards[idx], key, time.monotonic())
 
     def _delete(self, key: str):
         """Delete key"""
-        with self._lock:
-            self._store.pop(key, None)
-
-    def _cleanup_expired(self):
-        """Background task to clean up expired entries"""
-        while self._cleanup_running:
-            time.sleep(60)  # Run every minute
-            current_time = time.time()
-            with self._lock:
-                expired_keys = [
-                    k for k, v in self._store.items() if current_time > v["expiry"]
-                ]
-                for key in expired_keys:
-                    del self._store[key]
-                if expired_keys:
-                    print(f"Cleaned up {len(expired_keys)} expired state entries")
-
-    def start_cleanup_task(self):
-        """Start background cleanup thread"""
-        if not self._cleanup_running:
-            self._cleanup_running = True
-            cleanup_thread = threading.Thread(
-                target=self._cleanup_expired, daemon=True, name="StateCleanup"
-            )
-            cleanup_thread.start()
-            print("State cleanup task started")
-
-    def stop_cleanup_task(self):
-        """Stop background cleanup thread"""
-        self._cleanup_running = False
+        idx = self._shard_idx(key)
+        with self._locks[idx]:
+            self._shards[idx].pop(key, None)
+
+    # ========================= Batch Read =========================
+
+    def get_project_state(self, project_dir: str) -> dict:
+        """Read plan, discovered tools and discovered mcps under one lock acquisition."""
+        plan_key = self._make_key("plan", project_dir)
+        tools_key = self._make_key("discovered_tools", project_dir)
+        mcps_key = self._make_key("discovered_mcps", project_dir)
+        idx = self._shard_idx(plan_key)
+        shard = self._shards[idx]
+        now = time.monotonic()
+        with self._locks[idx]:
+            plan = self._get_locked(shard, plan_key, now)
+            tools = self._get_locked(shard, tools_key, now)
+            mcps = self._get_locked(shard, mcps_key, now)
+        return {
+            "plan": plan,
+            "tools": tools or frozenset(),
+            "mcps": mcps or frozenset(),
+        }
 
     # ========================= Plan Data =========================
 
     def set_plan(self, project_dir:str, plan: str) -> None:
         """Set the plan for a user"""
-        try:
-            key = self._make_key("plan", project_dir)
-            self._set_with_ttl(key, plan, 3600)
-        except Exception as e:
-            print(f"State error in set_plan: {e}")
+        key = self._make_key("plan", project_dir)
+        self._set_with_ttl(key, plan, 3600)
 
     def get_plan(self, project_dir: str) -> str:
         """Get the plan for a user"""
-        try:
-            key = self._make_key("plan",project_dir)
-            return self._get(key)
-        except Exception as e:
-            print(f"State error in get_plan: {e}")
-            return None
+        key = self._make_key("plan",project_dir)
+        return self._get(key)
 
     ##########################tool discovery
 
-    def get_discovered_tools(self, project_dir: str) -> set:
-        try:
-            key = self._make_key("discovered_tools", project_dir)
-            data = self._get(key)
-            if not data:
-                return set()
-            return set(data.get("discovered_tools", []))
-        except Exception as e:
-            print(f"State error in get_discovered_tools: {e}")
-            return set()
+    def get_discovered_tools(self, project_dir: str) -> frozenset:
+        """Stored as a frozenset and returned as-is (no copy per read)."""
+        key = self._make_key("discovered_tools", project_dir)
+        return self._get(key) or frozenset()
 
     def add_discovered_tools(self, project_dir: str, tools: list):
-        try:
-            existing = self.get_discovered_tools(project_dir)
-            existing.update(tools)
-            data = {"discovered_tools": list(existing)}
-            key = self._make_key("discovered_tools", project_dir)
-            self._set_with_ttl(key, data, 180)
-        except Exception as e:
-            print(f"State error in add_discovered_tools: {e}")
+        existing = self.get_discovered_tools(project_dir)
+        key = self._make_key("discovered_tools", project_dir)
+        self._set_with_ttl(key, existing.union(tools), 180)
 
     def clear_discovered_tools(self, project_dir: str):
-        try:
-            key = self._make_key("discovered_tools", project_dir)
-            self._delete(key)
-        except Exception as e:
-            print(f"State error in clear_discovered_tools: {e}")
+        key = self._make_key("discovered_tools", project_dir)
+        self._delete(key)
 
     ########################## mcp discovery
 
-    def get_discovered_mcps(self, project_dir: str) -> set:
-        try:
-            key = self._make_key("discovered_mcps", project_dir)
-            data = self._get(key)
-            if not data:
-                return set()
-            return set(data.get("discovered_mcps", []))
-        except Exception as e:
-            print(f"State error in get_discovered_mcps: {e}")
-            return set()
+    def get_discovered_mcps(self, project_dir: str) -> frozenset:
+        """Stored as a frozenset and returned as-is (no copy per read)."""
+        key = self._make_key("discovered_mcps", project_dir)
+        return self._get(key) or frozenset()
 
     def add_discovered_mcps(self, project_dir: str, mcps: list):
-        try:
-            existing = self.get_discovered_mcps(project_dir)
-            existing.update(mcps)
-            data = {"discovered_mcps": list(existing)}
-            key = self._make_key("discovered_mcps", project_dir)
-            self._set_with_ttl(key, data, 180)
-        except Exception as e:
-            print(f"State error in add_discovered_mcps: {e}")
+        existing = self.get_discovered_mcps(project_dir)
+        key = self._make_key("discovered_mcps", project_dir)
+        self._set_with_ttl(key, existing.union(mcps), 180)
 
     def clear_discovered_mcps(self, project_dir: str):
-        try:
-            key = self._make_key("discovered_mcps", project_dir)
-            self._delete(key)
-        except Exception as e:
-            print(f"State error in clear_discovered_mcps: {e}")
+        key = self._make_key("discovered_mcps", project_dir)
+        self._delete(key)
 
     ########################## stop signal
 
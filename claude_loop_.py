@@ -28,7 +28,7 @@ from tools.search_tool_ import (
 from tools.mcp_client_ import resolve_mcp_for_litellm, call_mcp_tool
 from utils.msg_store_ import store_msgs, load_msgs, load_summary, summarize_and_trim
 from utils.tokenization_simple import token_cutter
-from utils.helpers import tokenizer
+from utils._tokenizer import get_tokenizer
 from utils.claude_md_loader import load_claude_md_file
 from utils.helpers import get_endpoint
 
@@ -38,6 +38,38 @@ load_dotenv()
 
 DANGEROUS_TOOLS = {"bash_", "edit_", "write_"}
 
+# Core tools: bash, file ops, search, planning, skills
+_CORE_TOOLS = [
+    bash_,
+    read_, write_, edit_, glob_, grep_,
+    search_tools,
+    make_plan, update_step, show_full_plan, add_step,
+    read_skill, list_skills,
+]
+# Schemas and name->callable map are pure functions of the tool objects — build once
+DEFAULT_SCHEMAS = [function_to_schema(tool) for tool in _CORE_TOOLS]
+DEFAULT_TOOLS = {
+    (tool.func.__name__ if isinstance(tool, partial) else tool.__name__): tool
+    for tool in _CORE_TOOLS
+}
+
+
+def _assistant_content(thinking_block, text_block, tool_blocks) -> list[dict]:
+    """Assistant turn content: optional thinking + text, then one tool_use per block."""
+    head = []
+    if thinking_block:
+        head.append({
+            "type": "thinking",
+            "thinking": thinking_block.thinking,
+            "signature": thinking_block.signature,
+        })
+    if text_block:
+        head.append({"type": "text", "text": text_block.text})
+    return head + [
+        {"type": "tool_use", "id": tb.id, "name": tb.name, "input": tb.input}
+        for tb in tool_blocks
+    ]
+
 
 async def claude_loop(
     query,
@@ -57,38 +89,21 @@ async def claude_loop(
 
     msgs = load_msgs(project_dir)
 
-    skills_summary = get_skill_summary()
-    claude_md_content = load_claude_md_file(project_dir)
+    # Per-call copies: discovered tools/mcps get appended below
+    tool_schemas = list(DEFAULT_SCHEMAS)
+    tools = dict(DEFAULT_TOOLS)
 
-    # Core tools: bash, file ops, search, planning, skills
-    default_tools = [
-        bash_,
-        read_, write_, edit_, glob_, grep_,
-        search_tools,
-        make_plan, update_step, show_full_plan, add_step,
-        read_skill, list_skills,
-    ]
-    tool_schemas = []
-    for tool in default_tools:
-        tool_schemas.append(function_to_schema(tool))
-
-    ######construct all for execute_tool func!
-    tools = {}
-    for tool in default_tools:
-        if isinstance(tool, partial):
-            tools[tool.func.__name__] = tool
-        else:
-            tools[tool.__name__] = tool
+    project_state = redis_state.get_project_state(project_dir)
 
     #########discovered tools
-    discovered_tools = redis_state.get_discovered_tools(project_dir)
+    discovered_tools = project_state["tools"]
     for tool_name in discovered_tools:
         if tool_name not in tools:
             tool_schemas.append(get_tool_schema(tool_name))
             tools[tool_name] = get_tool_func(tool_name)
 
     ###############discovered mcps
-    discovered_mcp = redis_state.get_discovered_mcps(project_dir)
+    discovered_mcp = project_state["mcps"]
     mcp_servers = []       # Anthropic server-side: server configs for API param
     mcp_openai_tools = []  # LiteLLM client-side: pre-fetched OpenAI-format tool defs
     mcp_routing = {}       # LiteLLM client-side: {tool_name: server_url}
@@ -101,14 +116,16 @@ async def claude_loop(
                 mcp_openai_tools, mcp_routing = await resolve_mcp_for_litellm(mcp_entries)
         else:
             # Anthropic server-side: just pass configs, API handles everything
-            mcp_servers = [get_mcp_server(name) for name in discovered_mcp]
-            tool_schemas.extend([get_mcp_toolset(name) for name in discovered_mcp])
+            for name in discovered_mcp:
+                mcp_servers.append(get_mcp_server(name))
+                tool_schemas.append(get_mcp_toolset(name))
 
     yield {"type": "status", "message": ""}
 
     # If this is the first message, initialize with system prompt
     if not msgs:
-
+        skills_summary = get_skill_summary()
+        claude_md_content = load_claude_md_file(project_dir)
         claude_md_section = f"\n\n<project-instructions>\n{claude_md_content}\n</project-instructions>" if claude_md_content else ""
 
         msgs = [
@@ -162,6 +179,11 @@ make_plan, update_step, show_full_plan, add_step
     store_msgs(project_dir, msgs)
 
     interrupted = False
+    # id(msg) -> token count; msgs is append-only so counts stay valid for the call
+    token_counts = {}
+    # First pass reuses the plan from project_state; tools can change it after
+    plan_data = project_state["plan"]
+    first_pass = True
 
     while True:
         if _stopped():
@@ -190,14 +212,16 @@ make_plan, update_step, show_full_plan, add_step
 
         # Plan reminder (full contextual, as system)
         plan_msg = []
-        plan_data = redis_state.get_plan(project_dir)
+        if not first_pass:
+            plan_data = redis_state.get_plan(project_dir)
+        first_pass = False
         if plan_data:
             plan = json.loads(plan_data)
             contextual_reminder = get_contextual_plan_reminder(plan)
             plan_msg = [{"role": "system", "content": f"<system-reminder>{contextual_reminder}\n\nUse 'update_step' after each research/work session.</system-reminder>"}]
 
         # Assemble: system context + plan prepended, then conversation
-        trimmed_loop_msgs = token_cutter(msgs, tokenizer, max_tokens)
+        trimmed_loop_msgs = token_cutter(msgs, get_tokenizer(), max_tokens, token_counts)
         trimmed_loop_msgs = system_context + plan_msg + trimmed_loop_msgs
 
         try:
@@ -244,15 +268,19 @@ make_plan, update_step, show_full_plan, add_step
                 yield {"type": "error", "message": "model call failed after retries"}
                 break
 
-            thinking_block = next(
-                (block for block in response.content if block.type == "thinking"), None
-            )
-            text_block = next(
-                (block for block in response.content if block.type == "text"), None
-            )
-            tool_use_blocks = [
-                block for block in response.content if block.type == "tool_use"
-            ]
+            # Single pass: first thinking, first text, all tool_use blocks
+            thinking_block = text_block = None
+            tool_use_blocks = []
+            for block in response.content:
+                btype = block.type
+                if btype == "tool_use":
+                    tool_use_blocks.append(block)
+                elif btype == "thinking":
+                    if thinking_block is None:
+                        thinking_block = block
+                elif btype == "text":
+                    if text_block is None:
+                        text_block = block
 
             # thinking + text already streamed as deltas above
 
@@ -276,28 +304,21 @@ make_plan, update_step, show_full_plan, add_step
                                 mcp_servers.append(get_mcp_server(tb.name))
                                 tool_schemas.append(get_mcp_toolset(tb.name))
 
-                # Split into: local tools, client-side MCP tools, truly unknown
-                local_tool_blocks = [tb for tb in tool_use_blocks if tb.name in tools]
-                mcp_tool_blocks = [tb for tb in tool_use_blocks if tb.name in mcp_routing]
-                unknown_blocks = [tb for tb in tool_use_blocks
-                                  if tb.name not in tools and tb.name not in mcp_routing]
+                # Split into: local tools, client-side MCP tools, truly unknown (one pass)
+                local_tool_blocks = []
+                mcp_tool_blocks = []
+                unknown_blocks = []
+                for tb in tool_use_blocks:
+                    if tb.name in tools:
+                        local_tool_blocks.append(tb)
+                    elif tb.name in mcp_routing:
+                        mcp_tool_blocks.append(tb)
+                    else:
+                        unknown_blocks.append(tb)
 
                 # Hallucinated tool names — must send error tool_result or API hangs
                 if unknown_blocks:
-                    content_blocks = []
-                    if thinking_block:
-                        content_blocks.append({
-                            "type": "thinking",
-                            "thinking": thinking_block.thinking,
-                            "signature": thinking_block.signature,
-                        })
-                    for tb in unknown_blocks:
-                        content_blocks.append({
-                            "type": "tool_use",
-                            "id": tb.id,
-                            "name": tb.name,
-                            "input": tb.input,
-                        })
+                    content_blocks = _assistant_content(thinking_block, None, unknown_blocks)
                     msgs.append({"role": "assistant", "content": content_blocks})
                     msgs.append({"role": "user", "content": [
                         {
@@ -365,31 +386,7 @@ make_plan, update_step, show_full_plan, add_step
                     break
 
                 if all_blocks:
-                    content_blocks = []
-                    if thinking_block:
-                        content_blocks.append(
-                            {
-                                "type": "thinking",
-                                "thinking": thinking_block.thinking,
-                                "signature": thinking_block.signature,
-                            }
-                        )
-                    if text_block:
-                        content_blocks.append(
-                            {
-                                "type": "text",
-                                "text": text_block.text,
-                            }
-                        )
-                    for tb in all_blocks:
-                        content_blocks.append(
-                            {
-                                "type": "tool_use",
-                                "id": tb.id,
-                                "name": tb.name,
-                                "input": tb.input,
-                            }
-                        )
+                    content_blocks = _assistant_content(thinking_block, text_block, all_blocks)
                     msgs.append({"role": "assistant", "content": content_blocks})
 
                     tool_result_blocks = []
@@ -415,15 +412,17 @@ make_plan, update_step, show_full_plan, add_step
                                         mcp_servers.append(get_mcp_server(m_name))
                                         tool_schemas.append(get_mcp_toolset(m_name))
 
+                        # API requires string content - serialize dicts (once; reused for display)
+                        content = str(result) if isinstance(result, dict) else (result or "")
+                        display = content if isinstance(content, str) else str(content)
+
                         yield {
                             "type": "tool_result",
                             "name": tool_block.name,
-                            "output": str(result)[:500],  # Truncated for display
+                            "output": display[:500],  # Truncated for display
                             "id": tool_block.id,
                         }
 
-                        # API requires string content - serialize dicts
-                        content = str(result) if isinstance(result, dict) else (result or "")
                         tool_result_blocks.append(
                             {
                                 "type": "tool_result",
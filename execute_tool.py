@@ -1,7 +1,18 @@
+import functools
 import inspect
 from typing import Any, Dict
 
 
+# Keyed on the tool itself (the cache holds a reference, so ids can't be reused)
+@functools.lru_cache(maxsize=256)
+def _tool_meta(tool) -> tuple[bool, bool]:
+    """(accepts_project_dir, is_coroutine) for a tool callable."""
+    return (
+        "project_dir" in inspect.signature(tool).parameters,
+        inspect.iscoroutinefunction(tool),
+    )
+
+
 async def execute_tool_call(
     tool_call,  # Anthropic SDK ToolUseBlock object
     tools: Dict[str, callable],
@@ -26,12 +37,12 @@ async def execute_tool_call(
     tool = tools[name]
 
     try:
-        sig = inspect.signature(tool)
-        if "project_dir" in sig.parameters:
+        accepts_project_dir, is_coro = _tool_meta(tool)
+        if accepts_project_dir:
             args = {**args, "project_dir": project_dir}
 
         # Execute tool (sync or async)
-        if inspect.iscoroutinefunction(tool):
+        if is_coro:
             result = await tool(**args)
         else:
             result = tool(**args)
@@ -4,6 +4,7 @@ from dotenv import load_dotenv
 from dataclasses import dataclass, field
 import asyncio
 import json
+import weakref
 
 
 import os
@@ -29,36 +30,42 @@ class Response:
 
 async def _wrap_stream(raw_stream):
     """Iterate Anthropic SDK stream, yield standardized deltas + final Response."""
-    text = ""
-    thinking = ""
-    thinking_signature = ""
+    # Accumulate deltas as parts and join once at the end
+    text_parts = []
+    thinking_parts = []
+    signature_parts = []
     tool_blocks = []
     current_tool = None
 
     async for event in raw_stream:
         if event.type == "content_block_start":
             if event.content_block.type == "tool_use":
-                current_tool = {"id": event.content_block.id, "name": event.content_block.name, "input_json": ""}
+                current_tool = {"id": event.content_block.id, "name": event.content_block.name, "input_json": []}
 
         elif event.type == "content_block_delta":
             if event.delta.type == "text_delta":
-                text += event.delta.text
+                text_parts.append(event.delta.text)
                 yield {"type": "text_delta", "text": event.delta.text}
             elif event.delta.type == "thinking_delta":
-                thinking += event.delta.thinking
+                thinking_parts.append(event.delta.thinking)
                 yield {"type": "thinking_delta", "thinking": event.delta.thinking}
             elif event.delta.type == "signature_delta":
-                thinking_signature += event.delta.signature or ""
+                signature_parts.append(event.delta.signature or "")
             elif event.delta.type == "input_json_delta":
                 if current_tool:
-                    current_tool["input_json"] += event.delta.partial_json
+                    current_tool["input_json"].append(event.delta.partial_json)
 
         elif event.type == "content_block_stop":
             if current_tool:
-                args = json.loads(current_tool["input_json"]) if current_tool["input_json"] else {}
+                input_json = "".join(current_tool["input_json"])
+                args = json.loads(input_json) if input_json else {}
                 tool_blocks.append(current_tool | {"input": args})
                 current_tool = None
 
+    text = "".join(text_parts)
+    thinking = "".join(thinking_parts)
+    thinking_signature = "".join(signature_parts)
+
     blocks = []
     if thinking:
         blocks.append(ContentBlock(type="thinking", thinking=thinking, signature=thinking_signature))
@@ -69,6 +76,38 @@ async def _wrap_stream(raw_stream):
 
     yield {"type": "response", "response": Response(content=blocks)}
 
+
+# (id(event loop), timeout) -> (loop weakref, client). Reusing the client keeps
+# its pooled keep-alive connections, but that pool is bound to the loop it first
+# ran on, so every loop (e.g. each asyncio.run) gets its own client
+_CLIENTS: Dict[tuple, tuple] = {}
+
+
+def _get_client(client_timeout: int) -> AsyncAnthropic:
+    loop = asyncio.get_running_loop()
+    key = (id(loop), client_timeout)
+    entry = _CLIENTS.get(key)
+    if entry is None or entry[0]() is not loop:
+        # Drop clients of loops that are gone or closed (ids can be reused)
+        for k in [k for k, (ref, _) in _CLIENTS.items() if ref() is None or ref().is_closed()]:
+            del _CLIENTS[k]
+        entry = _CLIENTS[key] = (
+            weakref.ref(loop),
+            AsyncAnthropic(timeout=client_timeout),
+        )
+    return entry[1]
+
+
+_MODEL_ALIASES = {
+    "opus-4.6": "claude-opus-4-6",
+    "sonnet-4.6": "claude-sonnet-4-6",
+    "haiku-4.5": "claude-haiku-4-5-20251001",
+    # legacy aliases
+    "claude-4.6": "claude-sonnet-4-6",
+    "claude-4.5-haiku": "claude-haiku-4-5-20251001",
+}
+
+
 async def a_model_call(
     input: Union[List[Dict[str, Any]], str],
     model="claude-4.6",
@@ -82,18 +121,9 @@ async def a_model_call(
     pdf: str = None,
     retries: int = 3,
 ):
-    client = AsyncAnthropic(timeout=client_timeout)
+    client = _get_client(client_timeout)
     base_sleep = 2
-
-    MODEL_MAP = {
-        "opus-4.6": "claude-opus-4-6",
-        "sonnet-4.6": "claude-sonnet-4-6",
-        "haiku-4.5": "claude-haiku-4-5-20251001",
-        # legacy aliases
-        "claude-4.6": "claude-sonnet-4-6",
-        "claude-4.5-haiku": "claude-haiku-4-5-20251001",
-    }
-    model = MODEL_MAP.get(model, "claude-sonnet-4-6")
+    model = _MODEL_ALIASES.get(model, "claude-sonnet-4-6")
 
     system_prompts = []
     messages = []
@@ -15,6 +15,7 @@ from dotenv import load_dotenv
 from dataclasses import dataclass, field
 import asyncio
 import json
+import weakref
 import os
 
 load_dotenv(os.path.expanduser("~/.micro-cc/.env"))
@@ -214,23 +215,24 @@ def _wrap_response(openai_resp):
 async def _wrap_stream(openai_stream):
     """Accumulate OpenAI chunks, yield Anthropic-shaped events,
     return final Response with ContentBlocks."""
-    text = ""
-    thinking = ""
+    # Accumulate deltas as parts and join once at the end
+    text_parts = []
+    thinking_parts = []
     thinking_signature = ""
-    tool_calls = {}  # index -> {id, name, arguments_str}
+    tool_calls = {}  # index -> {id, name, args (list of fragments)}
 
     async for chunk in openai_stream:
         delta = chunk.choices[0].delta
 
         # Text — can yield immediately
         if delta.content:
-            text += delta.content
+            text_parts.append(delta.content)
             yield {"type": "text_delta", "text": delta.content}
 
         # Thinking — can yield immediately
         rc = getattr(delta, "reasoning_content", None)
         if rc:
-            thinking += rc
+            thinking_parts.append(rc)
             yield {"type": "thinking_delta", "thinking": rc}
 
         # Tool calls — must buffer arguments
@@ -241,10 +243,13 @@ async def _wrap_stream(openai_stream):
                     tool_calls[idx] = {
                         "id": tc.id or "",
                         "name": tc.function.name if tc.function else "",
-                        "args": "",
+                        "args": [],
                     }
                 if tc.function and tc.function.arguments:
-                    tool_calls[idx]["args"] += tc.function.arguments
+                    tool_calls[idx]["args"].append(tc.function.arguments)
+
+    text = "".join(text_parts)
+    thinking = "".join(thinking_parts)
 
     # Stream done — build final Response for claude_loop_
     blocks = []
@@ -257,7 +262,8 @@ async def _wrap_stream(openai_stream):
     if text:
         blocks.append(ContentBlock(type="text", text=text))
     for tc in tool_calls.values():
-        args = json.loads(tc["args"]) if tc["args"] else {}
+        args_json = "".join(tc["args"])
+        args = json.loads(args_json) if args_json else {}
         blocks.append(
             ContentBlock(type="tool_use", name=tc["name"], input=args, id=tc["id"])
         )
@@ -265,6 +271,41 @@ async def _wrap_stream(openai_stream):
     yield {"type": "response", "response": Response(content=blocks)}
 
 
+# (id(event loop), timeout) -> (loop weakref, client). Reusing the client keeps
+# its pooled keep-alive connections, but that pool is bound to the loop it first
+# ran on, so every loop (e.g. each asyncio.run) gets its own client
+_CLIENTS: Dict[tuple, tuple] = {}
+
+
+def _get_client(client_timeout: int) -> AsyncOpenAI:
+    loop = asyncio.get_running_loop()
+    key = (id(loop), client_timeout)
+    entry = _CLIENTS.get(key)
+    if entry is None or entry[0]() is not loop:
+        # Drop clients of loops that are gone or closed (ids can be reused)
+        for k in [k for k, (ref, _) in _CLIENTS.items() if ref() is None or ref().is_closed()]:
+            del _CLIENTS[k]
+        entry = _CLIENTS[key] = (
+            weakref.ref(loop),
+            AsyncOpenAI(
+                base_url=os.getenv("LITELLM_BASE_URL", ""),
+                api_key=os.getenv("LITELLM_API_KEY", ""),
+                timeout=client_timeout,
+            ),
+        )
+    return entry[1]
+
+
+_MODEL_ALIASES = {
+    "opus-4.6": "bedrock.anthropic.claude-opus-4-6",
+    "sonnet-4.6": "bedrock.anthropic.claude-sonnet-4-6",
+    "haiku-4.5": "bedrock.anthropic.claude-haiku-4-5",
+    # legacy aliases
+    "claude-4.6": "bedrock.anthropic.claude-sonnet-4-6",
+    "claude-4.5-haiku": "bedrock.anthropic.claude-haiku-4-5",
+}
+
+
 # ---------------------------------------------------------------------------
 # Main model call — same signature as models/anthropic.py
 # ---------------------------------------------------------------------------
@@ -282,24 +323,9 @@ async def l_model_call(
     pdf: str = None,
     retries: int = 3,
 ):
-    client = AsyncOpenAI(
-        base_url=os.getenv(
-            "LITELLM_BASE_URL", ""
-        ),
-        api_key=os.getenv("LITELLM_API_KEY", ""),
-        timeout=client_timeout,
-    )
+    client = _get_client(client_timeout)
     base_sleep = 2
-
-    MODEL_MAP = {
-        "opus-4.6": "bedrock.anthropic.claude-opus-4-6",
-        "sonnet-4.6": "bedrock.anthropic.claude-sonnet-4-6",
-        "haiku-4.5": "bedrock.anthropic.claude-haiku-4-5",
-        # legacy aliases
-        "claude-4.6": "bedrock.anthropic.claude-sonnet-4-6",
-        "claude-4.5-haiku": "bedrock.anthropic.claude-haiku-4-5",
-    }
-    model = MODEL_MAP.get(model, "bedrock.anthropic.claude-sonnet-4-6")
+    model = _MODEL_ALIASES.get(model, "bedrock.anthropic.claude-sonnet-4-6")
 
     # ---- Build messages ----
     messages = []
@@ -12,8 +12,41 @@ import inspect
 import json
 import re
 
-
-INTERNAL_PARAMS = ["project_dir"]
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+INTERNAL_PARAMS = frozenset({"project_dir"})
+
+# Google docstring: "name (type): description" — precompiled, used per line
+_PARAM_RE = re.compile(r"^(\w+)\s*(?:\([^)]*\))?\s*:\s*(.*)$")
+_ARGS_HEADERS = frozenset(("Args:", "Arguments:", "Parameters:"))
+_OTHER_HEADERS = frozenset((
+    "Returns:",
+    "Return:",
+    "Yields:",
+    "Raises:",
+    "Examples:",
+    "Example:",
+    "Note:",
+    "Notes:",
+))
+
+# Basic Python types -> JSON Schema type name (fresh dict built per lookup)
+_TYPE_MAP = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    dict: "object",
+    list: "array",
+    bytes: "string",
+}
 
 
 def python_type_to_json_schema(py_type) -> Dict[str, Any]:
@@ -24,18 +57,9 @@ def python_type_to_json_schema(py_type) -> Dict[str, Any]:
         return {"type": "null"}
 
     # Handle basic types
-    type_map = {
-        str: {"type": "string"},
-        int: {"type": "integer"},
-        float: {"type": "number"},
-        bool: {"type": "boolean"},
-        dict: {"type": "object"},
-        list: {"type": "array"},
-        bytes: {"type": "string"},
-    }
-
-    if py_type in type_map:
-        return type_map[py_type]
+    json_type = _TYPE_MAP.get(py_type) if isinstance(py_type, type) else None
+    if json_type is not None:
+        return {"type": json_type}
 
     if is_typeddict(py_type):
         hints = get_type_hints(py_type)
@@ -120,20 +144,11 @@ def parse_google_docstring(docstring: str) -> tuple[str, Dict[str, str]]:
         stripped = line.strip()
 
         # Detect section headers
-        if stripped in ("Args:", "Arguments:", "Parameters:"):
+        if stripped in _ARGS_HEADERS:
             in_args_section = True
             in_returns_section = False
             continue
-        elif stripped in (
-            "Returns:",
-            "Return:",
-            "Yields:",
-            "Raises:",
-            "Examples:",
-            "Example:",
-            "Note:",
-            "Notes:",
-        ):
+        elif stripped in _OTHER_HEADERS:
             # Save last param if any
             if current_param and current_desc_lines:
                 param_descriptions[current_param] = " ".join(current_desc_lines).strip()
@@ -147,11 +162,10 @@ def parse_google_docstring(docstring: str) -> tuple[str, Dict[str, str]]:
             if not stripped:
                 continue
 
-            # Calculate indentation
-            indent = len(line) - len(line.lstrip())
-
-            # Check if this is a new parameter (name: description pattern)
-            param_match = re.match(r"^(\w+)\s*(?:\([^)]*\))?\s*:\s*(.*)$", stripped)
+            # Check if this is a new parameter (name: description pattern);
+            # indentation only matters for candidate param lines
+            param_match = _PARAM_RE.match(stripped)
+            indent = len(line) - len(line.lstrip()) if param_match else None
 
             if param_match and (base_indent is None or indent == base_indent):
                 # Save previous param
@@ -194,34 +208,34 @@ def parse_legacy_docstring(docstring: str) -> tuple[str, Dict[str, Any]]:
     if not docstring or "#parameters:" not in docstring:
         return docstring.strip() if docstring else "", {}
 
-    doc_parts = docstring.split("#parameters:")
-    main_description = doc_parts[0].strip()
-    param_section = doc_parts[1].strip() if len(doc_parts) > 1 else ""
+    head, _, param_section = docstring.partition("#parameters:")
+    main_description = head.strip()
 
     param_data = {}
     current_param = None
     current_content = []
 
-    for line in param_section.split("\n"):
+    for line in param_section.splitlines():
         line = line.strip()
         if not line:
             continue
 
-        if ":" in line and not line.startswith(" "):
+        key, sep, rest = line.partition(":")
+        if sep:
             # Save previous param
             if current_param and current_content:
                 content = " ".join(current_content).strip()
                 # Try parsing as JSON schema
                 if content.startswith("{") and content.endswith("}"):
                     try:
-                        param_data[current_param] = json.loads(content)
+                        param_data[current_param] = _loads(content)
                     except json.JSONDecodeError:
                         param_data[current_param] = content
                 else:
                     param_data[current_param] = content
 
-            current_param = line.split(":", 1)[0].strip()
-            current_content = [line.split(":", 1)[1].strip()]
+            current_param = key.strip()
+            current_content = [rest.strip()]
         elif current_param:
             current_content.append(line)
 
@@ -230,7 +244,7 @@ def parse_legacy_docstring(docstring: str) -> tuple[str, Dict[str, Any]]:
         content = " ".join(current_content).strip()
         if content.startswith("{") and content.endswith("}"):
             try:
-                param_data[current_param] = json.loads(content)
+                param_data[current_param] = _loads(content)
             except json.JSONDecodeError:
                 param_data[current_param] = content
         else:
@@ -279,16 +293,17 @@ def function_to_schema(func: callable) -> Dict[str, Any]:
     properties = {}
     required_params = []
 
+    # Bind Parameter sentinels once rather than per parameter
+    _VAR_KINDS = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    _EMPTY = inspect.Parameter.empty
+
     for param_name, param in sig.parameters.items():
         # Skip internal params
         if param_name in INTERNAL_PARAMS:
             continue
 
         # Skip *args and **kwargs
-        if param.kind in (
-            inspect.Parameter.VAR_POSITIONAL,
-            inspect.Parameter.VAR_KEYWORD,
-        ):
+        if param.kind in _VAR_KINDS:
             continue
 
         # Get type from hints
@@ -306,8 +321,7 @@ def function_to_schema(func: callable) -> Dict[str, Any]:
                     prop = python_type_to_json_schema(py_type)
                 else:
                     prop = {"type": "string"}
-                prop["description"] = data
-                properties[param_name] = prop
+                properties[param_name] = {**prop, "description": data}
         else:
             # Google-style or no docs
             if py_type:
@@ -316,12 +330,12 @@ def function_to_schema(func: callable) -> Dict[str, Any]:
                 prop = {"type": "string"}
 
             if param_name in param_data:
-                prop["description"] = param_data[param_name]
+                prop = {**prop, "description": param_data[param_name]}
 
             properties[param_name] = prop
 
         # Determine if required
-        if param.default == inspect.Parameter.empty:
+        if param.default is _EMPTY:
             # Check if Optional type (has None in union)
             if py_type:
                 origin = get_origin(py_type)
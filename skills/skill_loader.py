@@ -7,6 +7,8 @@ Progressive disclosure pattern:
 3. Level 3: Agent reads reference files or executes scripts via kernel
 """
 
+import json
+import logging
 import os
 import re
 from pathlib import Path
@@ -16,8 +18,28 @@ from typing import Optional
 _skills_cache: dict = {}
 _cache_initialized = False
 
+# Skill name -> SKILL.md body, filled on first get_skill_content
+_body_cache: dict[str, str] = {}
+# Skill name -> relative file paths in its folder, filled on first list_skill_files
+_files_cache: dict[str, tuple[str, ...]] = {}
+# get_available_skills result, built once per load
+_available_cache: Optional[list[dict]] = None
+# Bumped by reload_skills so callers can key their own caches on it
+_generation = 0
+
+logger = logging.getLogger(__name__)
+
 SKILLS_DIR = Path(__file__).parent
 
+# Parsed frontmatter persisted across restarts, keyed by skill dir and gated on
+# SKILL.md (mtime_ns, size). Lives in ~/.micro-cc so pip installs work too.
+_DISK_CACHE_FILE = Path.home() / ".micro-cc" / "skills_cache.json"
+
+# YAML frontmatter between --- markers, then the body
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+# "key: value" lines inside the frontmatter
+_YAML_KV_RE = re.compile(r'^[ \t]*([A-Za-z_][\w-]*)[ \t]*:[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
 
 def _parse_yaml_frontmatter(content: str) -> tuple[dict, str]:
     """Parse YAML frontmatter from markdown content.
@@ -28,31 +50,41 @@ def _parse_yaml_frontmatter(content: str) -> tuple[dict, str]:
     frontmatter = {}
     body = content
 
-    # Match YAML frontmatter between --- markers
-    pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
 
     if match:
         yaml_content = match.group(1)
         body = match.group(2)
 
-        # Simple YAML parsing (name: value pairs)
-        for line in yaml_content.split('\n'):
-            line = line.strip()
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip()
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-                frontmatter[key] = value
+        # Simple YAML parsing (name: value pairs), quotes stripped if paired
+        frontmatter = {
+            k: (v[1:-1] if len(v) >= 2 and v[0] == v[-1] and v[0] in '"\'' else v)
+            for k, v in _YAML_KV_RE.findall(yaml_content)
+        }
 
     return frontmatter, body
 
 
+def _read_disk_cache() -> dict:
+    try:
+        with open(_DISK_CACHE_FILE, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_disk_cache(entries: dict):
+    try:
+        _DISK_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = f"{_DISK_CACHE_FILE}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(tmp, _DISK_CACHE_FILE)
+    except OSError:
+        pass
+
+
 def _load_skills():
     """Scan skills/ folder and load all SKILL.md frontmatter."""
     global _skills_cache, _cache_initialized
@@ -62,35 +94,58 @@ def _load_skills():
 
     _skills_cache = {}
 
-    if not SKILLS_DIR.exists():
+    try:
+        it = os.scandir(SKILLS_DIR)
+    except FileNotFoundError:
         _cache_initialized = True
         return
 
-    for skill_dir in SKILLS_DIR.iterdir():
-        if not skill_dir.is_dir():
-            continue
-
-        skill_file = skill_dir / 'SKILL.md'
-        if not skill_file.exists():
-            continue
-
-        try:
-            content = skill_file.read_text(encoding='utf-8')
-            frontmatter, body = _parse_yaml_frontmatter(content)
-
-            name = frontmatter.get('name', skill_dir.name)
-            description = frontmatter.get('description', '')
-
+    disk_cache = _read_disk_cache()
+    fresh_cache = {}
+
+    with it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+
+            skill_file = os.path.join(entry.path, 'SKILL.md')
+            try:
+                st = os.stat(skill_file)
+            except FileNotFoundError:
+                continue
+            stat_key = [st.st_mtime_ns, st.st_size]
+
+            cached = disk_cache.get(entry.path)
+            if isinstance(cached, dict) and cached.get('stat') == stat_key:
+                name = cached.get('name', entry.name)
+                description = cached.get('description', '')
+            else:
+                try:
+                    with open(skill_file, encoding='utf-8') as f:
+                        content = f.read()
+                except (OSError, UnicodeDecodeError):
+                    logger.exception("Error loading skill from %s", entry.path)
+                    continue
+
+                frontmatter, _ = _parse_yaml_frontmatter(content)
+                name = frontmatter.get('name', entry.name)
+                description = frontmatter.get('description', '')
+
+            fresh_cache[entry.path] = {'name': name, 'description': description, 'stat': stat_key}
             _skills_cache[name] = {
                 'name': name,
                 'description': description,
-                'path': str(skill_dir),
-                'skill_file': str(skill_file),
-                'full_content': content,
-                'body': body,
+                'path': entry.path,
+                'skill_file': skill_file,
             }
-        except Exception as e:
-            print(f"Error loading skill from {skill_dir}: {e}")
+
+    # Keep entries for other install locations; rewrite only on change
+    merged = {**disk_cache, **fresh_cache}
+    for path in disk_cache.keys() - fresh_cache.keys():
+        if path.startswith(str(SKILLS_DIR) + os.sep):
+            del merged[path]  # skill removed from this install
+    if merged != disk_cache:
+        _write_disk_cache(merged)
 
     _cache_initialized = True
 
@@ -101,11 +156,14 @@ def get_available_skills() -> list[dict]:
     Returns:
         List of dicts with 'name' and 'description' keys.
     """
+    global _available_cache
     _load_skills()
-    return [
-        {'name': skill['name'], 'description': skill['description']}
-        for skill in _skills_cache.values()
-    ]
+    if _available_cache is None:
+        _available_cache = [
+            {'name': skill['name'], 'description': skill['description']}
+            for skill in _skills_cache.values()
+        ]
+    return [dict(s) for s in _available_cache]
 
 
 def get_skill_summary() -> str:
@@ -137,10 +195,21 @@ def get_skill_content(skill_name: str) -> Optional[str]:
     """
     _load_skills()
 
+    body = _body_cache.get(skill_name)
+    if body is not None:
+        return body
+
     skill = _skills_cache.get(skill_name)
-    if skill:
-        return skill['body']  # Return body without frontmatter
-    return None
+    if not skill:
+        return None
+
+    try:
+        with open(skill['skill_file'], encoding='utf-8') as f:
+            _, body = _parse_yaml_frontmatter(f.read())  # body without frontmatter
+    except OSError:
+        return None
+    _body_cache[skill_name] = body
+    return body
 
 
 def get_skill_path(skill_name: str) -> Optional[str]:
@@ -171,22 +240,42 @@ def list_skill_files(skill_name: str) -> list[str]:
     """
     _load_skills()
 
-    skill = _skills_cache.get(skill_name)
-    if not skill:
-        return []
+    files = _files_cache.get(skill_name)
+    if files is None:
+        skill = _skills_cache.get(skill_name)
+        if not skill:
+            return []
+        files = _files_cache[skill_name] = tuple(_walk_files(skill['path']))
+    return list(files)
 
-    skill_path = Path(skill['path'])
-    files = []
 
-    for item in skill_path.rglob('*'):
-        if item.is_file():
-            files.append(str(item.relative_to(skill_path)))
+def _walk_files(root: str):
+    """Yield file paths under root, relative to it (scandir, no Path objects)."""
+    prefix_len = len(root.rstrip(os.sep)) + 1
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path[prefix_len:]
+        except OSError:
+            continue
+
 
-    return files
+def skills_generation() -> int:
+    """Counter that changes on every reload_skills (for derived caches)."""
+    return _generation
 
 
 def reload_skills():
     """Force reload of skills cache. Useful after adding new skills."""
-    global _cache_initialized
+    global _cache_initialized, _available_cache, _generation
     _cache_initialized = False
+    _generation += 1
+    _available_cache = None
+    _body_cache.clear()
+    _files_cache.clear()
     _load_skills()
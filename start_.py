@@ -8,7 +8,7 @@ from prompt_toolkit import PromptSession
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.completion import PathCompleter
 from prompt_toolkit.completion import WordCompleter
-from rich.console import Console
+from rich.console import Console, Group
 from rich.markdown import Markdown
 from rich.live import Live
 from rich.markup import escape
@@ -16,7 +16,41 @@ from rich.status import Status
 from utils.file_watcher_ import FileWatcher
 
 
+# Non-interactive events whose output is batched into one render frame
+_BATCHED_EVENTS = frozenset(
+    ("status", "tool_call", "tool_result", "cancelled", "interrupted", "error")
+)
+_BATCH_WINDOW = 0.016
+
+_EXIT_CMDS = frozenset({"/exit", "/quit", "exit", "quit"})
+
+# Events that mean real content arrived — stop the spinner
+_SPINNER_STOP_EVENTS = frozenset(
+    ("thinking_delta", "text_delta", "tool_call", "approval_request",
+     "final_text", "done", "error", "cancelled", "interrupted")
+)
+
+
 async def consumeloop(query, project_dir, console, watcher: FileWatcher):
+    loop = asyncio.get_running_loop()
+    _pending = []
+    _flush_handle = None
+
+    def _flush():
+        nonlocal _flush_handle
+        if _flush_handle is not None:
+            _flush_handle.cancel()
+            _flush_handle = None
+        if _pending:
+            console.print(Group(*_pending))
+            _pending.clear()
+
+    def _emit(renderable):
+        nonlocal _flush_handle
+        _pending.append(renderable)
+        if _flush_handle is None:
+            _flush_handle = loop.call_later(_BATCH_WINDOW, _flush)
+
     _stream_text = ""
     _live = None
     _thinking_started = False
@@ -24,14 +58,125 @@ async def consumeloop(query, project_dir, console, watcher: FileWatcher):
     _spinner.start()
     _spinning = True
 
+    # Event handlers — sync ones return None, async ones a coroutine
+
+    def _on_status(event):
+        _emit(f"  ⋯ {event.get('message', '')}")
+
+    async def _on_approval_request(event):
+        name = event.get("name", "")
+        inp = event.get("input", {})
+        approval = event.get("approval", None)
+
+        console.print(f"\n  ⚠️  [bold yellow]{name}[/bold yellow]")
+        if name == "bash_tool" and isinstance(inp, dict):
+            cmd = inp.get("command", str(inp))
+            console.print(Markdown(f"```bash\n{cmd}\n```"))
+        elif name in ("write_", "edit_") and isinstance(inp, dict):
+            fp = inp.get("file_path", "")
+            # For edit_, find the line number of old_string in the actual file
+            line_info = ""
+            if name == "edit_" and "old_string" in inp:
+                try:
+                    _abs = fp if os.path.isabs(fp) else os.path.join(project_dir, fp)
+                    with open(_abs, "r", encoding="utf-8") as _f:
+                        _src = _f.read()
+                    _pos = _src.find(inp["old_string"])
+                    if _pos != -1:
+                        _line = _src[:_pos].count("\n") + 1
+                        _end = _line + inp["old_string"].count("\n")
+                        line_info = f" [dim]L{_line}–{_end}[/dim]" if _end > _line else f" [dim]L{_line}[/dim]"
+                except Exception:
+                    pass
+            console.print(f"  [dim]file:[/dim] {fp}{line_info}")
+            for k in ("content", "old_string", "new_string"):
+                if k in inp:
+                    console.print(Markdown(f"**{k}:**\n```\n{inp[k]}\n```"))
+        else:
+            console.print(Markdown(f"```\n{inp}\n```"))
+
+        approval_session = PromptSession()
+        response = (
+            (await approval_session.prompt_async("  Execute? [Y/n]: "))
+            .strip()
+            .lower()
+        )
+
+        if response in ("", "yes", "y"):
+            approval["approved"] = True
+        else:
+            approval["approved"] = False
+            console.print("  ⊘ cancelled")
+
+    def _on_cancelled(event):
+        _emit("  ⊘ cancelled · conversation saved")
+
+    def _on_interrupted(event):
+        _emit("\n  ⊘ interrupted · conversation saved")
+
+    def _on_thinking_delta(event):
+        nonlocal _thinking_started
+        if not _thinking_started:
+            print("  💭 ", end="", flush=True)
+            _thinking_started = True
+        print(event.get("content", ""), end="", flush=True)
+
+    def _on_text_delta(event):
+        nonlocal _stream_text, _live
+        _stream_text += event.get("content", "")
+        if _live is None:
+            _live = Live(
+                Markdown(_stream_text), console=console, refresh_per_second=10
+            )
+            _live.start()
+        else:
+            _live.update(Markdown(_stream_text))
+
+    def _on_tool_call(event):
+        name = event.get("name", "?")
+        _emit(f"  🔧 [cyan]{escape(name)}[/cyan]")
+
+    def _on_tool_result(event):
+        nonlocal _spinner, _spinning
+        name = event.get("name", "?")
+        output = event.get("output", "")
+        short = output.replace("\n", " ").strip()[:60]
+        if len(output.strip()) > 60:
+            short += "…"
+        _emit(f"  ✓ [dim]{name}[/dim] {escape(short)}")
+        # Restart spinner — model goes back to API
+        _spinner = Status("  ⋯ thinking", console=console, spinner="dots")
+        _spinner.start()
+        _spinning = True
+
+    def _on_error(event):
+        _emit(f"\n⚠️  {escape(event.get('message', 'Unknown error'))}\n")
+
+    # final_text / done are signals only — text already rendered via deltas
+    handlers = {
+        "status": _on_status,
+        "approval_request": _on_approval_request,
+        "cancelled": _on_cancelled,
+        "interrupted": _on_interrupted,
+        "thinking_delta": _on_thinking_delta,
+        "text_delta": _on_text_delta,
+        "tool_call": _on_tool_call,
+        "tool_result": _on_tool_result,
+        "error": _on_error,
+    }
+
     try:
         async for event in claude_loop(
             query=query, project_dir=project_dir, watcher=watcher,
         ):
             etype = event.get("type")
 
+            # Anything interactive or streamed renders after what's queued
+            if etype not in _BATCHED_EVENTS:
+                _flush()
+
             # Stop spinner when real content arrives
-            if _spinning and etype in ("thinking_delta", "text_delta", "tool_call", "approval_request", "final_text", "done", "error", "cancelled", "interrupted"):
+            if _spinning and etype in _SPINNER_STOP_EVENTS:
                 _spinner.stop()
                 _spinning = False
 
@@ -46,102 +191,14 @@ async def consumeloop(query, project_dir, console, watcher: FileWatcher):
                 print()
                 _thinking_started = False
 
-            if etype == "status":
-                console.print(f"  ⋯ {event.get('message', '')}")
-
-            elif etype == "approval_request":
-                name = event.get("name", "")
-                inp = event.get("input", {})
-                approval = event.get("approval", None)
-
-                console.print(f"\n  ⚠️  [bold yellow]{name}[/bold yellow]")
-                if name == "bash_tool" and isinstance(inp, dict):
-                    cmd = inp.get("command", str(inp))
-                    console.print(Markdown(f"```bash\n{cmd}\n```"))
-                elif name in ("write_", "edit_") and isinstance(inp, dict):
-                    fp = inp.get("file_path", "")
-                    # For edit_, find the line number of old_string in the actual file
-                    line_info = ""
-                    if name == "edit_" and "old_string" in inp:
-                        try:
-                            _abs = fp if os.path.isabs(fp) else os.path.join(project_dir, fp)
-                            with open(_abs, "r", encoding="utf-8") as _f:
-                                _src = _f.read()
-                            _pos = _src.find(inp["old_string"])
-                            if _pos != -1:
-                                _line = _src[:_pos].count("\n") + 1
-                                _end = _line + inp["old_string"].count("\n")
-                                line_info = f" [dim]L{_line}–{_end}[/dim]" if _end > _line else f" [dim]L{_line}[/dim]"
-                        except Exception:
-                            pass
-                    console.print(f"  [dim]file:[/dim] {fp}{line_info}")
-                    for k in ("content", "old_string", "new_string"):
-                        if k in inp:
-                            console.print(Markdown(f"**{k}:**\n```\n{inp[k]}\n```"))
-                else:
-                    console.print(Markdown(f"```\n{inp}\n```"))
-
-                approval_session = PromptSession()
-                response = (
-                    (await approval_session.prompt_async("  Execute? [Y/n]: "))
-                    .strip()
-                    .lower()
-                )
-
-                if response in ("", "yes", "y"):
-                    approval["approved"] = True
-                else:
-                    approval["approved"] = False
-                    console.print("  ⊘ cancelled")
-
-            elif etype == "cancelled":
-                console.print("  ⊘ cancelled · conversation saved")
-
-            elif etype == "interrupted":
-                console.print("\n  ⊘ interrupted · conversation saved")
-
-            elif etype == "thinking_delta":
-                if not _thinking_started:
-                    print("  💭 ", end="", flush=True)
-                    _thinking_started = True
-                print(event.get("content", ""), end="", flush=True)
-
-            elif etype == "text_delta":
-                _stream_text += event.get("content", "")
-                if _live is None:
-                    _live = Live(
-                        Markdown(_stream_text), console=console, refresh_per_second=10
-                    )
-                    _live.start()
-                else:
-                    _live.update(Markdown(_stream_text))
-
-            elif etype == "tool_call":
-                name = event.get("name", "?")
-                console.print(Markdown(f"  🔧 `{name}`"))
-
-            elif etype == "tool_result":
-                name = event.get("name", "?")
-                output = event.get("output", "")
-                short = output.replace("\n", " ").strip()[:60]
-                if len(output.strip()) > 60:
-                    short += "…"
-                console.print(f"  ✓ [dim]{name}[/dim] {escape(short)}")
-                # Restart spinner — model goes back to API
-                _spinner = Status("  ⋯ thinking", console=console, spinner="dots")
-                _spinner.start()
-                _spinning = True
-
-            elif etype == "final_text":
-                pass  # signal only — text already rendered via deltas
-
-            elif etype == "error":
-                console.print(Markdown(f"\n⚠️  {event.get('message', 'Unknown error')}\n"))
-
-            elif etype == "done":
-                pass
+            handler = handlers.get(etype)
+            if handler is not None:
+                pending = handler(event)
+                if pending is not None:
+                    await pending
     finally:
-        # Always clean up Live display and spinner
+        # Always flush pending output and clean up Live display and spinner
+        _flush()
         try:
             _spinner.stop()
         except Exception:
@@ -291,11 +348,11 @@ async def start_():
                             if block.get("type") == "text":
                                 await _safe_print_md(f"\n{block['text']}\n")
                             elif block.get("type") == "tool_use":
-                                console.print(Markdown(f"  🔧 `{block['name']}`"))
+                                console.print(f"  🔧 [cyan]{escape(block['name'])}[/cyan]")
 
         console.print("  ╰─── end history · /clear to reset ───\n")
 
-    # Start file watcher + process tracker + cache cleanup
+    # Start file watcher + process tracker
     watcher = FileWatcher(project_dir)
     watcher.start()
     from utils.process_tracker import init as init_process_tracker
@@ -303,7 +360,6 @@ async def start_():
 
     init_process_tracker()
     _state_mgr = RedisStateManager()
-    _state_mgr.start_cleanup_task()
     console.print("  👾 watching for file changes\n")
 
     # Main loop
@@ -315,7 +371,7 @@ async def start_():
             if not query:
                 continue
 
-            if query.lower() in ("/exit", "/quit", "exit", "quit"):
+            if query.lower() in _EXIT_CMDS:
                 console.print("\n  👋 bye\n")
                 break
 
@@ -369,12 +425,10 @@ async def start_():
             continue
         except EOFError:
             watcher.stop()
-            _state_mgr.stop_cleanup_task()
             console.print("\n  👋 bye\n")
             break
 
     watcher.stop()
-    _state_mgr.stop_cleanup_task()
 
 
 def main():
@@ -168,7 +168,6 @@ class MicroApp(App):
     async def on_mount(self):
         # Start background services
         self._watcher.start()
-        self._state_mgr.start_cleanup_task()
 
         # Status bar
         self.query_one("#statusbar", Static).update(f"📂 {self._project_dir} | ⚙️  Model: {self._current_model}")
@@ -385,7 +384,6 @@ class MicroApp(App):
 
     def on_unmount(self):
         self._watcher.stop()
-        self._state_mgr.stop_cleanup_task()
 
 
 def start_():
@@ -0,0 +1,93 @@
+"""glob_/grep_ walk (tools/file_tools_._glob_entries) against glob.glob(recursive=True)."""
+
+import glob
+import os
+import tempfile
+import unittest
+
+from tools.file_tools_ import _glob_entries, glob_
+
+TREE = [
+    "a.py",
+    "b.txt",
+    ".hidden.py",
+    "src/main.py",
+    "src/util.py",
+    "src/pkg/mod.py",
+    "src/pkg/data.json",
+    "src/.cache/c.py",
+    "docs/index.md",
+    "docs/guide/intro.md",
+    "empty/",
+]
+
+PATTERNS = [
+    "*.py",
+    "**/*.py",
+    "**",
+    "**/",
+    "src/**",
+    "src/**/",
+    "src/*.py",
+    "src/*/",
+    "*/",
+    "**/pkg/*",
+    "./src/*.py",
+    "./**/*.py",
+    "src/../docs/*.md",
+    "docs/./guide/*.md",
+    "src/main.py",
+    "src/missing.py",
+    ".hidden.py",
+    ".*",
+    "src/.cache/*.py",
+    "src/*/*.py",
+    "[ab].*",
+    "?.py",
+]
+
+
+class GlobWalkTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = self._tmp.name
+        for rel in TREE:
+            path = os.path.join(self.base, rel)
+            if rel.endswith("/"):
+                os.makedirs(path, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write("x\n")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _walk(self, pattern):
+        paths = [e.path for e in _glob_entries(self.base, pattern)]
+        if pattern.endswith("/"):
+            paths = [os.path.join(p, "") for p in paths]
+        return sorted(paths)
+
+    def test_matches_glob(self):
+        for pattern in PATTERNS:
+            with self.subTest(pattern=pattern):
+                expected = sorted(glob.glob(os.path.join(self.base, pattern), recursive=True))
+                self.assertEqual(self._walk(pattern), expected)
+
+    def test_glob_tool_dot_components(self):
+        out = glob_("./src/*.py", project_dir=self.base)
+        self.assertIn(os.path.join(self.base, ".", "src", "main.py"), out.splitlines())
+        out = glob_("src/../docs/*.md", project_dir=self.base)
+        self.assertEqual(out.splitlines(), [os.path.join(self.base, "src", "..", "docs", "index.md")])
+
+    def test_double_star_skips_symlinked_dirs(self):
+        os.symlink(os.path.join(self.base, "src"), os.path.join(self.base, "link"))
+        paths = self._walk("**/*.py")
+        self.assertNotIn(os.path.join(self.base, "link", "main.py"), paths)
+        self.assertIn(os.path.join(self.base, "src", "main.py"), paths)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,46 @@
 import asyncio
 import os
+from collections import deque
+
+_READ_CHUNK = 4096
+
+
+async def _drain_bounded(stream, limit: int) -> tuple[str, int]:
+    """Read a pipe to EOF keeping only the first and last `limit` bytes.
+
+    Returns (text, bytes dropped from the middle); the text carries its own
+    truncation marker when anything was dropped.
+    """
+    head = bytearray()
+    tail = deque()
+    tail_len = 0
+    total = 0
+
+    while chunk := await stream.read(_READ_CHUNK):
+        total += len(chunk)
+        if len(head) < limit:
+            take = limit - len(head)
+            head += chunk[:take]
+            chunk = chunk[take:]
+        if chunk:
+            tail.append(chunk)
+            tail_len += len(chunk)
+            # Drop whole chunks from the front while the rest still covers limit
+            while tail_len - len(tail[0]) >= limit:
+                tail_len -= len(tail.popleft())
+
+    tail_bytes = b"".join(tail)
+    dropped = total - len(head) - len(tail_bytes)
+    if dropped <= 0:
+        return (bytes(head) + tail_bytes).decode("utf-8", errors="replace"), 0
+
+    tail_bytes = tail_bytes[-limit:]
+    dropped = total - len(head) - len(tail_bytes)
+    return "".join((
+        head.decode("utf-8", errors="replace"),
+        f"\n\n... [TRUNCATED {dropped} bytes] ...\n\n",
+        tail_bytes.decode("utf-8", errors="replace"),
+    )), dropped
 
 
 async def bash_(
@@ -39,9 +80,19 @@ async def bash_(
             env={**os.environ, "TERM": "dumb"},
         )
 
+        # Stream both pipes into bounded head/tail buffers so memory stays
+        # ~max_output_chars no matter how much the command prints; each pipe
+        # keeps a quarter as head and a quarter as tail so both fit together
+        half = max_output_chars // 2
+        quarter = max_output_chars // 4
         try:
-            stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                proc.communicate(), timeout=timeout
+            (stdout, out_dropped), (stderr, err_dropped), _ = await asyncio.wait_for(
+                asyncio.gather(
+                    _drain_bounded(proc.stdout, quarter),
+                    _drain_bounded(proc.stderr, quarter),
+                    proc.wait(),
+                ),
+                timeout=timeout,
             )
         except asyncio.TimeoutError:
             proc.kill()
@@ -52,29 +103,29 @@ async def bash_(
             await proc.wait()
             raise  # re-raise so gather/task cancellation propagates
 
-        stdout = stdout_bytes.decode("utf-8", errors="replace")
-        stderr = stderr_bytes.decode("utf-8", errors="replace")
-
-        # Build output
+        # Build output as parts, join once
+        parts = []
         if proc.returncode != 0:
-            output = f"[Exit code: {proc.returncode}]\n"
+            parts.append(f"[Exit code: {proc.returncode}]\n")
             if stderr:
-                output += f"STDERR:\n{stderr}\n"
+                parts += ("STDERR:\n", stderr, "\n")
             if stdout:
-                output += f"STDOUT:\n{stdout}"
+                parts += ("STDOUT:\n", stdout)
         else:
-            output = stdout
+            parts.append(stdout)
             if stderr:
-                output += f"\n[STDERR]: {stderr}"
-
-        # Truncate if too long (keep head + tail)
-        if len(output) > max_output_chars:
-            half = max_output_chars // 2
-            output = (
-                output[:half] +
-                f"\n\n... [TRUNCATED {len(output) - max_output_chars} chars] ...\n\n" +
-                output[-half:]
-            )
+                parts += ("\n[STDERR]: ", stderr)
+
+        output = "".join(parts)
+
+        # Truncate if too long (keep head + tail); already-truncated pipes
+        # fit the budget and carry their own markers
+        if not (out_dropped or err_dropped) and len(output) > max_output_chars:
+            output = "".join((
+                output[:half],
+                f"\n\n... [TRUNCATED {len(output) - max_output_chars} chars] ...\n\n",
+                output[-half:],
+            ))
 
         return output.strip() or "[No output]"
 
@@ -1,8 +1,234 @@
 import os
-import glob as glob_module
+import fnmatch
+import functools
+import mmap
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+# Files at least this large are read through mmap, walking only the
+# requested line window; below it readlines() is cheaper than mmap setup
+_MMAP_MIN_SIZE = 64 * 1024
+_COUNT_CHUNK = 1 << 20
+_EOL = "\r\n"
+# A CR not followed by LF: text mode starts a new line there, the mmap path can't
+_BARE_CR = re.compile(rb"\r(?!\n)")
+# Same wildcard test as glob.has_magic
+_GLOB_MAGIC = re.compile(r"[*?[]")
+_BINARY_PROBE = 4096
+
+# Constructs whose meaning differs between str and bytes regexes (any-char,
+# negated classes, Unicode-aware classes, code point escapes like \xe9 / \u00e9 /
+# \N{...} / octal); patterns free of them can run on raw bytes
+_NOT_BYTES_SAFE = re.compile(r"\.|\[\^|\\[wWsSdDbBxuUN0-7]")
+
+# End/whole-string anchors: on a single line "$" also matches after the line's
+# newline and \A at its start, which a whole-file search can't mirror
+_LINE_ANCHORS = re.compile(r"\$|\\[AZ]")
+
+
+def _read_lines_mmap(file_path: str, offset: int, limit: int) -> Optional[tuple[list[str], int]]:
+    """Return (lines in [offset, offset+limit), total line count) via mmap.
+
+    Returns None for files with bare CR line endings; read those in text mode.
+    """
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm.find(b"\r") >= 0 and _BARE_CR.search(mm):
+            return None
+        size = len(mm)
+        pos = 0
+
+        # Skip to offset
+        line_no = 0
+        while line_no < offset and pos < size:
+            nl = mm.find(b"\n", pos)
+            pos = size if nl < 0 else nl + 1
+            line_no += 1
+
+        # Collect the window, decoding only these lines
+        selected = []
+        while len(selected) < limit and pos < size:
+            nl = mm.find(b"\n", pos)
+            end = size if nl < 0 else nl + 1
+            selected.append(mm[pos:end].decode("utf-8", errors="replace"))
+            pos = end
+
+        # Count the rest in chunks for the "more lines" footer
+        remaining = 0
+        if pos < size:
+            for i in range(pos, size, _COUNT_CHUNK):
+                remaining += mm[i:i + _COUNT_CHUNK].count(b"\n")
+            if mm[size - 1] != 0x0A:
+                remaining += 1
+
+    return selected, line_no + len(selected) + remaining
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled(pattern: str | bytes, flags: int) -> re.Pattern:
+    """Compiled grep regex, reused across calls (raises re.error)."""
+    return re.compile(pattern, flags)
+
+
+def _scan_matches(buf, regex, line_regex, context_lines: int, nl):
+    """Yield (match_line, first_line, block) for each line of buf with a match.
+
+    regex (MULTILINE) searches the whole buffer to jump to candidate lines;
+    each candidate is confirmed by line_regex on that line alone (with its
+    newline, as readlines() gives it), so matches never span lines. With
+    regex=None every line is checked, for patterns whose per-line anchoring
+    ($, \\A, \\Z) a buffer-wide search can't mirror.
+    Line numbers (0-indexed) come from counting newlines between matches.
+    block is the raw slice of context lines (str or bytes, same as buf).
+    """
+    n = len(buf)
+    pos = 0
+    line_no = 0
+    counted_to = 0
+
+    while pos < n:
+        if regex is None:
+            start = pos
+        else:
+            m = regex.search(buf, pos)
+            if m is None:
+                break
+            start = m.start()
+            if start >= n:
+                break  # empty match past the final newline — no line there
+
+        ls = buf.rfind(nl, 0, start) + 1
+        le = buf.find(nl, start)
+        if le < 0:
+            le = n
+        line_end = min(le + 1, n)
+
+        if line_regex.search(buf[ls:line_end]) is None:
+            pos = line_end
+            continue
+        line_no += buf.count(nl, counted_to, ls)
+        counted_to = ls
+
+        # Widen to context lines before/after
+        ctx_start, before = ls, 0
+        while before < context_lines and ctx_start > 0:
+            ctx_start = buf.rfind(nl, 0, ctx_start - 1) + 1
+            before += 1
+        ctx_end = le
+        for _ in range(context_lines):
+            if ctx_end + 1 >= n:
+                break
+            nxt = buf.find(nl, ctx_end + 1)
+            ctx_end = n if nxt < 0 else nxt
+
+        yield line_no, line_no - before, buf[ctx_start:ctx_end]
+        pos = line_end
+
+
+class _PathEntry:
+    """DirEntry stand-in for paths not yielded by scandir: literal pattern
+    components and the directory a trailing "**" starts from (as "dir/")."""
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def is_dir(self, follow_symlinks=True):
+        if not follow_symlinks and os.path.islink(self.path.rstrip(os.sep)):
+            return False
+        return os.path.isdir(self.path)
+
+    def is_file(self, follow_symlinks=True):
+        if not follow_symlinks and os.path.islink(self.path):
+            return False
+        return os.path.isfile(self.path)
+
+    def stat(self, follow_symlinks=True):
+        return os.stat(self.path, follow_symlinks=follow_symlinks)
+
+
+def _glob_entries(base: str, pattern: str):
+    """Yield DirEntry objects matching a glob pattern under base.
+
+    os.scandir walk with glob's recursive semantics: "**" spans zero or more
+    directories, and hidden names only match components that start with ".".
+    A trailing "/" restricts matches to directories, as with glob. Components
+    without wildcards (including "." and "..") are joined directly, not matched.
+    Directory entries carry their readdir type, so no per-path stat is needed.
+    """
+    if os.path.isabs(pattern):
+        base = os.sep
+    parts = [p for p in pattern.split("/") if p]
+    if parts:
+        # Each component compiled once for the whole walk
+        matchers = [
+            None if p == "**" or not _GLOB_MAGIC.search(p) else _compiled(fnmatch.translate(p), 0).match
+            for p in parts
+        ]
+        entries = _glob_walk(base, parts, matchers, 0)
+        if pattern.endswith("/"):
+            entries = (e for e in entries if e.is_dir())
+        yield from entries
+
+
+def _glob_walk(dirpath: str, parts: list[str], matchers: list, i: int):
+    part = parts[i]
+    last = i == len(parts) - 1
+
+    if part == "**":
+        if last:
+            yield _PathEntry(os.path.join(dirpath, ""))
+            yield from _walk_all(dirpath)
+            return
+        # Zero directories, then descend and retry this component
+        yield from _glob_walk(dirpath, parts, matchers, i + 1)
+        for entry in _scan(dirpath):
+            if entry.name[0] != "." and entry.is_dir(follow_symlinks=False):
+                yield from _glob_walk(entry.path, parts, matchers, i)
+        return
+
+    match = matchers[i]
+    if match is None:
+        # Literal component: no listing, just check the joined path
+        path = os.path.join(dirpath, part)
+        if last:
+            if os.path.lexists(path):
+                yield _PathEntry(path)
+        elif os.path.isdir(path):
+            yield from _glob_walk(path, parts, matchers, i + 1)
+        return
+
+    show_hidden = part[0] == "."
+    for entry in _scan(dirpath):
+        if entry.name[0] == "." and not show_hidden:
+            continue
+        if not match(entry.name):
+            continue
+        if last:
+            yield entry
+        elif entry.is_dir():
+            yield from _glob_walk(entry.path, parts, matchers, i + 1)
+
+
+def _walk_all(dirpath: str):
+    """Every non-hidden entry below dirpath, depth-first."""
+    for entry in _scan(dirpath):
+        if entry.name[0] == ".":
+            continue
+        yield entry
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_all(entry.path)
+
+
+def _scan(dirpath: str) -> list:
+    try:
+        with os.scandir(dirpath) as it:
+            return list(it)
+    except OSError:
+        return []
+
 
 def read_(
     file_path: str,
@@ -29,24 +255,27 @@ def read_(
         return f"[Path is a directory, not a file: {file_path}]"
 
     try:
-        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
-
-        total_lines = len(lines)
+        window = None
+        if os.path.getsize(file_path) >= _MMAP_MIN_SIZE:
+            window = _read_lines_mmap(file_path, offset, limit)
+        if window is not None:
+            selected, total_lines = window
+        else:
+            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+                lines = f.readlines()
 
-        # Apply offset and limit
-        selected = lines[offset:offset + limit]
+            total_lines = len(lines)
 
-        # Format with line numbers (1-indexed for display)
-        output_lines = []
-        for i, line in enumerate(selected):
-            line_num = offset + i + 1
-            # Truncate very long lines
-            if len(line) > 2000:
-                line = line[:2000] + "... [truncated]"
-            output_lines.append(f"{line_num:6d}\t{line.rstrip()}")
+            # Apply offset and limit
+            selected = lines[offset:offset + limit]
 
-        output = "\n".join(output_lines)
+        # Format with line numbers (1-indexed for display), truncating very
+        # long lines; only the line ending is stripped
+        output = "\n".join([
+            f"{line_num:6d}\t{line.rstrip(_EOL)}" if len(line) <= 2000
+            else f"{line_num:6d}\t{line[:2000]}... [truncated]"
+            for line_num, line in enumerate(selected, offset + 1)
+        ])
 
         if offset + limit < total_lines:
             output += f"\n\n[... {total_lines - offset - limit} more lines]"
@@ -78,8 +307,14 @@ def write_(
         if parent and not os.path.exists(parent):
             os.makedirs(parent)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Encode once and write straight to the fd, no buffered text layer
+        data = memoryview(content.encode("utf-8"))
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
 
         lines = content.count("\n") + 1
         return f"Wrote {lines} lines to {file_path}"
@@ -117,25 +352,30 @@ def edit_(
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
 
-        count = content.count(old_string)
+        pos = content.find(old_string)
 
-        if count == 0:
+        if pos < 0:
             return f"[String not found in {file_path}]"
 
-        if count > 1 and not replace_all:
-            return f"[String found {count} times - use replace_all=True or provide more context]"
+        if replace_all:
+            # One split pass both counts and cuts (str.split rejects "")
+            if old_string:
+                parts = content.split(old_string)
+                count = len(parts) - 1
+                new_content = new_string.join(parts)
+            else:
+                count = content.count(old_string)
+                new_content = content.replace(old_string, new_string)
+        else:
+            count = content.count(old_string)
+            if count > 1:
+                return f"[String found {count} times - use replace_all=True or provide more context]"
 
-        # Find line number(s) before replacement
-        if not replace_all:
-            pos = content.find(old_string)
-            start_line = content[:pos].count('\n') + 1
+            # Line number(s) of the match, counted in place without slicing
+            start_line = content.count('\n', 0, pos) + 1
             end_line = start_line + old_string.count('\n')
 
-        # Perform replacement
-        if replace_all:
-            new_content = content.replace(old_string, new_string)
-        else:
-            new_content = content.replace(old_string, new_string, 1)
+            new_content = content[:pos] + new_string + content[pos + len(old_string):]
 
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(new_content)
@@ -159,6 +399,9 @@ def glob_(
 ) -> str:
     """Find files matching glob pattern.
 
+    "**" does not descend into symlinked directories; pass the link itself as
+    path to search one.
+
     Args:
         pattern: Glob pattern (e.g., "**/*.py", "src/*.ts")
         path: Directory to search in (default: project_dir)
@@ -171,19 +414,22 @@ def glob_(
         return f"[Directory not found: {base_path}]"
 
     try:
-        # Use recursive glob
-        full_pattern = os.path.join(base_path, pattern)
-        matches = glob_module.glob(full_pattern, recursive=True)
+        # Recursive glob via scandir, collecting (path, mtime) in the same pass;
+        # lstat via the DirEntry so a dangling symlink can't fail the sort
+        found = [
+            (e.path, e.stat(follow_symlinks=False).st_mtime)
+            for e in _glob_entries(base_path, pattern)
+        ]
+        if pattern.endswith("/"):
+            # Directory-only pattern: report "dir/" like glob does
+            found = [(os.path.join(p, ""), t) for p, t in found]
 
         # Sort by modification time (newest first)
-        matches.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+        found.sort(key=lambda t: t[1], reverse=True)
 
         # Limit results
-        if len(matches) > 100:
-            matches = matches[:100]
-            truncated = True
-        else:
-            truncated = False
+        truncated = len(found) > 100
+        matches = [p for p, _ in found[:100]]
 
         if not matches:
             return f"No files matching '{pattern}' in {base_path}"
@@ -198,6 +444,51 @@ def glob_(
         return f"[Glob error: {type(e).__name__}: {e}]"
 
 
+def _grep_file(
+    filepath: str, regex, line_regex, use_bytes: bool, context_lines: int, budget: int
+) -> list[str]:
+    """Formatted match blocks for one file, stopping once they exceed budget chars."""
+    try:
+        with open(filepath, "rb") as f:
+            head = f.read(_BINARY_PROBE)
+            # NUL in the first chunk means binary (same probe as git grep)
+            if b"\0" in head:
+                return []
+            raw = head + f.read()
+
+        # Match text-mode universal newlines
+        if use_bytes:
+            buf = raw
+            if b"\r" in buf:
+                buf = buf.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            nl = b"\n"
+        else:
+            buf = raw.decode("utf-8", errors="replace")
+            if "\r" in buf:
+                buf = buf.replace("\r\n", "\n").replace("\r", "\n")
+            nl = "\n"
+
+        entries = []
+        size = 0
+        for match_line, first_line, block in _scan_matches(buf, regex, line_regex, context_lines, nl):
+            if use_bytes:
+                block = block.decode("utf-8", errors="replace")
+            context = []
+            for j, line in enumerate(block.split("\n"), first_line):
+                prefix = ">" if j == match_line else " "
+                context.append(f"{prefix}{j+1:6d}: {line.rstrip()}")
+
+            entry = "\n".join(context)
+            entries.append(entry)
+            size += len(entry)
+            if size > budget:
+                break
+        return entries
+
+    except Exception:
+        return []  # Skip unreadable files
+
+
 def grep_(
     pattern: str,
     *,
@@ -209,6 +500,8 @@ def grep_(
 ) -> str:
     """Search file contents with regex pattern.
 
+    Directory searches don't descend into symlinked directories.
+
     Args:
         pattern: Regex pattern to search for
         path: File or directory to search (default: project_dir)
@@ -225,53 +518,76 @@ def grep_(
 
     try:
         flags = re.IGNORECASE if ignore_case else 0
-        regex = re.compile(pattern, flags)
+        line_regex = _compiled(pattern, flags)
+        # ASCII patterns run on undecoded bytes; only matching lines get decoded
+        if pattern.isascii() and not _NOT_BYTES_SAFE.search(pattern):
+            try:
+                line_regex = _compiled(pattern.encode("ascii"), flags)
+            except re.error:
+                pass  # str-only syntax; keep the str regex
+        # Whole-file prefilter (MULTILINE keeps ^ at line starts), unless the
+        # pattern uses anchors whose per-line meaning it can't reproduce
+        regex = None
+        if not _LINE_ANCHORS.search(pattern):
+            regex = _compiled(line_regex.pattern, flags | re.MULTILINE)
     except re.error as e:
         return f"[Invalid regex: {e}]"
 
-    results = []
-    files_searched = 0
-    matches_found = 0
+    use_bytes = isinstance(line_regex.pattern, bytes)
 
-    def search_file(filepath):
-        nonlocal matches_found
-        try:
-            with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()
+    max_output_chars = 50000
 
-            file_matches = []
-            for i, line in enumerate(lines):
-                if regex.search(line):
-                    # Gather context
-                    start = max(0, i - context_lines)
-                    end = min(len(lines), i + context_lines + 1)
+    results = []
+    matches_found = 0
+    output_chars = 0  # running length of the joined output
 
-                    context = []
-                    for j in range(start, end):
-                        prefix = ">" if j == i else " "
-                        context.append(f"{prefix}{j+1:6d}: {lines[j].rstrip()}")
+    def merge(filepath, entries):
+        nonlocal matches_found, output_chars
+        file_matches = []
+        for entry in entries:
+            # "\n---\n" between matches; "\n" (join) + "\n{filepath}:\n" before the first
+            output_chars += len(entry) + (5 if file_matches else len(filepath) + 3 + bool(results))
+            file_matches.append(entry)
+            matches_found += 1
 
-                    file_matches.append("\n".join(context))
-                    matches_found += 1
+            # Past the output budget everything else would be truncated away
+            if output_chars > max_output_chars:
+                break
 
-            if file_matches:
-                results.append(f"\n{filepath}:\n" + "\n---\n".join(file_matches))
+        if file_matches:
+            results.append(f"\n{filepath}:\n" + "\n---\n".join(file_matches))
 
-        except Exception:
-            pass  # Skip unreadable files
+    def done():
+        return matches_found >= 500 or output_chars > max_output_chars
 
     if os.path.isfile(base_path):
-        files_searched = 1
-        search_file(base_path)
+        merge(base_path, _grep_file(
+            base_path, regex, line_regex, use_bytes, context_lines, max_output_chars
+        ))
     else:
-        # Search directory
+        # Search directory: files are read and scanned on worker threads while
+        # results merge in walk order, so output matches a sequential search
         glob_pat = file_pattern or "**/*"
-        files = glob_module.glob(os.path.join(base_path, glob_pat), recursive=True)
-
-        for filepath in files:
-            if os.path.isfile(filepath) and matches_found < 500:
-                files_searched += 1
-                search_file(filepath)
+        workers = min(8, os.cpu_count() or 1)
+        files = (e.path for e in _glob_entries(base_path, glob_pat) if e.is_file())
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for filepath in files:
+                pending.append((filepath, ex.submit(
+                    _grep_file, filepath, regex, line_regex, use_bytes, context_lines, max_output_chars
+                )))
+                # Keep a bounded window in flight; stop walking once capped
+                if len(pending) >= workers * 4:
+                    filepath, fut = pending.popleft()
+                    merge(filepath, fut.result())
+                    if done():
+                        break
+            while pending and not done():
+                filepath, fut = pending.popleft()
+                merge(filepath, fut.result())
+            for _, fut in pending:
+                fut.cancel()
 
     if not results:
         return f"No matches for '{pattern}' in {base_path}"
@@ -279,7 +595,7 @@ def grep_(
     output = "\n".join(results)
 
     # Truncate if too long
-    if len(output) > 50000:
-        output = output[:50000] + "\n\n[... output truncated]"
+    if len(output) > max_output_chars:
+        output = output[:max_output_chars] + "\n\n[... output truncated]"
 
     return output
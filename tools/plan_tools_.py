@@ -1,7 +1,30 @@
+import functools
 import json
 import time
 from cache.redis_cache import RedisStateManager
 
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+# Shared manager, created on first use (state is class-level anyway)
+_redis_state = None
+
+
+def _rs() -> RedisStateManager:
+    global _redis_state
+    if _redis_state is None:
+        _redis_state = RedisStateManager()
+    return _redis_state
+
 def make_plan(content: str, *, project_dir: str) -> str:
     """Create a new plan with task IDs and initial status.
 
@@ -15,13 +38,13 @@ def make_plan(content: str, *, project_dir: str) -> str:
             CRITICAL: For tasks involving multiple files, create a separate
             step for each source to prevent information loss.
     """
-    redis_state = RedisStateManager()
+    redis_state = _rs()
 
     if not content:
         return "Error: Content cannot be empty"
 
     try:
-        plan_data = json.loads(content)
+        plan_data = _loads(content)
 
         if "title" not in plan_data or "steps" not in plan_data:
             return "Error: Plan must have 'title' and 'steps' fields"
@@ -40,10 +63,10 @@ def make_plan(content: str, *, project_dir: str) -> str:
         }
 
         prev_plan = redis_state.get_plan(project_dir)
-        new_content = json.dumps(structured_plan)
+        new_content = _dumps(structured_plan)
         redis_state.set_plan(project_dir, new_content)
 
-        formatted_plan = format_structured_plan(structured_plan)
+        formatted_plan = _format_plan_json(new_content)
 
         diff = ""
         if prev_plan:
@@ -74,14 +97,14 @@ def update_step(
         findings: New findings for this step. IMPORTANT: Include ALL previous
             findings plus new ones - otherwise they get overwritten.
     """
-    redis_state = RedisStateManager()
+    redis_state = _rs()
 
     plan_data = redis_state.get_plan(project_dir)
     if not plan_data:
         return "Error: No plan exists. Create a plan first."
 
     try:
-        plan = json.loads(plan_data)
+        plan = _loads(plan_data)
 
         if step_index is None:
             step_index = plan.get("current_step_index", 0)
@@ -112,7 +135,7 @@ def update_step(
         if findings:
             plan["step_findings"][step_index] = findings
 
-        updated_plan = json.dumps(plan)
+        updated_plan = _dumps(plan)
         redis_state.set_plan(project_dir, updated_plan)
 
         return f"Step {step_index} updated successfully. The plan is saved. Continue with your next action based on the plan's focus."
@@ -130,14 +153,14 @@ def add_step(step_description: str, *, project_dir) -> str:
         step_description: Description of the new step. Be specific about
             what needs to be done.
     """
-    redis_state = RedisStateManager()
+    redis_state = _rs()
 
     plan_data = redis_state.get_plan(project_dir)
     if not plan_data:
         return "Error: No plan exists. Create a plan first."
 
     try:
-        plan = json.loads(plan_data)
+        plan = _loads(plan_data)
 
         # Always append to end - agents can't see full plan to make positioning decisions
         position = len(plan["steps"])
@@ -149,7 +172,7 @@ def add_step(step_description: str, *, project_dir) -> str:
 
         # No need to adjust current_step_index since we're appending to end
 
-        updated_plan = json.dumps(plan)
+        updated_plan = _dumps(plan)
         redis_state.set_plan(project_dir, updated_plan)
 
         # Show progress update
@@ -168,14 +191,14 @@ def advance_to_step(step_index: int, *, project_dir: str) -> str:
     Args:
         step_index: Step number to focus on (0-based). Must be an integer.
     """
-    redis_state = RedisStateManager()
+    redis_state = _rs()
 
     plan_data = redis_state.get_plan(project_dir)
     if not plan_data:
         return "Error: No plan exists. Create a plan first."
 
     try:
-        plan = json.loads(plan_data)
+        plan = _loads(plan_data)
 
         if isinstance(step_index, str):
             try:
@@ -189,7 +212,7 @@ def advance_to_step(step_index: int, *, project_dir: str) -> str:
         plan["current_step_index"] = step_index
         plan["step_statuses"][step_index] = "in_progress"
 
-        updated_plan = json.dumps(plan)
+        updated_plan = _dumps(plan)
         redis_state.set_plan(project_dir, updated_plan)
 
         return f"Advanced to step {step_index}. The plan is saved. Continue with your next action based on the plan's focus."
@@ -198,6 +221,14 @@ def advance_to_step(step_index: int, *, project_dir: str) -> str:
         return "Error: Invalid plan format"
 
 
+_STATUS_EMOJI = {
+    "completed": "✅",
+    "in_progress": "🔄",
+    "blocked": "❌",
+    "not_started": "⏳",
+}
+
+
 def format_structured_plan(plan: dict) -> str:
     """Format structured plan with focus on current step and progress"""
     if not plan:
@@ -210,42 +241,43 @@ def format_structured_plan(plan: dict) -> str:
     findings = plan.get("step_findings", [])
     current_index = plan.get("current_step_index", 0)
 
-    completed = sum(1 for status in statuses if status == "completed")
+    completed = statuses.count("completed")
     total = len(steps)
     progress_pct = (completed / total * 100) if total > 0 else 0
 
-    formatted = f"## 📋 {title}\n\n"
+    parts = [f"## 📋 {title}\n\n"]
 
     if context:
-        formatted += f"**Context:** {context}\n\n"
+        parts.append(f"**Context:** {context}\n\n")
 
-    formatted += (
+    parts.append(
         f"**Progress:** {completed}/{total} steps completed ({progress_pct:.1f}%)\n\n"
     )
 
     if current_index < len(steps):
-        formatted += f"**🎯 CURRENT FOCUS:** Step {current_index + 1}\n\n"
+        parts.append(f"**🎯 CURRENT FOCUS:** Step {current_index + 1}\n\n")
 
-    formatted += "**Steps:**\n"
+    parts.append("**Steps:**\n")
 
     for i, (step, status) in enumerate(zip(steps, statuses)):
-        status_emoji = {
-            "completed": "✅",
-            "in_progress": "🔄",
-            "blocked": "❌",
-            "not_started": "⏳",
-        }.get(status, "⏳")
+        status_emoji = _STATUS_EMOJI.get(status, "⏳")
 
         # Highlight current step
         current_marker = " ← **CURRENT**" if i == current_index else ""
 
-        formatted += f"{i + 1}. {status_emoji} {step}{current_marker}\n"
+        parts.append(f"{i + 1}. {status_emoji} {step}{current_marker}\n")
 
         # Show findings for current and recently completed steps
         if findings[i] and (i == current_index or status == "completed"):
-            formatted += f"   📝 *Findings:* {findings[i][:200]}{'...' if len(findings[i]) > 200 else ''}\n"
+            parts.append(f"   📝 *Findings:* {findings[i][:200]}{'...' if len(findings[i]) > 200 else ''}\n")
+
+    return "".join(parts)
+
 
-    return formatted
+@functools.lru_cache(maxsize=64)
+def _format_plan_json(plan_json: str) -> str:
+    """format_structured_plan keyed on the stored JSON; any edit is a new key."""
+    return format_structured_plan(_loads(plan_json))
 
 
 def get_contextual_plan_reminder(plan: dict) -> str:
@@ -268,35 +300,36 @@ def get_contextual_plan_reminder(plan: dict) -> str:
     # Count remaining work
     remaining = sum(1 for status in statuses[current_index:] if status != "completed")
 
-    reminder = f"🎯 **FOCUS ON STEP {current_index + 1}:** {current_step}\n"
-    reminder += f"Status: {current_status.upper()} | {remaining} steps remaining\n\n"
+    parts = [
+        f"🎯 **FOCUS ON STEP {current_index + 1}:** {current_step}\n",
+        f"Status: {current_status.upper()} | {remaining} steps remaining\n\n",
+    ]
 
     if current_findings:
-        reminder += f"**Previous findings for this step:** {current_findings}\n\n"
+        parts.append(f"**Previous findings for this step:** {current_findings}\n\n")
 
     # Show what's next
     if current_index + 1 < len(steps):
-        reminder += f"**Next step:** {steps[current_index + 1]}\n\n"
+        parts.append(f"**Next step:** {steps[current_index + 1]}\n\n")
 
-    reminder += (
+    parts.append(
         "Remember to use 'update_step' tool to record your findings before moving on! "
         "You can always use 'show_full_plan' to review all steps and findings at any point."
     )
 
-    return reminder
+    return "".join(parts)
 
 
 def show_full_plan(*, project_dir: str) -> str:
     """Show the complete plan with all steps and findings so far. Use this before creating final reports or deliverables to ensure you have full context."""
-    redis_state = RedisStateManager()
+    redis_state = _rs()
 
     plan_data = redis_state.get_plan(project_dir)
     if not plan_data:
         return "No plan exists"
 
     try:
-        plan = json.loads(plan_data)
-        formatted_plan = format_structured_plan(plan)
+        formatted_plan = _format_plan_json(plan_data)
         return f"📋 FULL PLAN AND FINDINGS:\n\n{formatted_plan}"
 
     except json.JSONDecodeError:
@@ -308,7 +341,7 @@ def get_post_tool_plan_reminder(plan_data: str, tool_name: str) -> str:
         return ""
 
     try:
-        plan = json.loads(plan_data)
+        plan = _loads(plan_data)
         current_index = plan.get("current_step_index", 0)
         steps = plan.get("steps", [])
         findings = plan.get("step_findings", [])
@@ -326,22 +359,22 @@ def get_post_tool_plan_reminder(plan_data: str, tool_name: str) -> str:
             findings[current_index] if current_index < len(findings) else ""
         )
 
-        reminder = f'[Internal planning note: 🎯 **PLAN FOCUS:** You just used `{tool_name}` while working on Step {current_index + 1}: "{current_step}"'
+        parts = [f'[Internal planning note: 🎯 **PLAN FOCUS:** You just used `{tool_name}` while working on Step {current_index + 1}: "{current_step}"']
 
         if current_findings:
-            reminder += f"\n📝 **EXISTING FINDINGS:** {current_findings}"
-            reminder += f"\n📋 **NEXT ACTION:** Use 'update_step' to ADD new findings to existing ones but make sure to include ALL previous existing findings plus new ones - otherwise you overwrite the previous findings and they get lost from your memory.  Even if the tool results are not satisfactory, write down what us your finding from them."
+            parts.append(f"\n📝 **EXISTING FINDINGS:** {current_findings}")
+            parts.append(f"\n📋 **NEXT ACTION:** Use 'update_step' to ADD new findings to existing ones but make sure to include ALL previous existing findings plus new ones - otherwise you overwrite the previous findings and they get lost from your memory.  Even if the tool results are not satisfactory, write down what us your finding from them.")
         else:
-            reminder += f"\n📋 **NEXT ACTION:** Use 'update_step' to record findings from this tool result. Even if the tool results are not satisfactory, write down what us your finding from them."
+            parts.append(f"\n📋 **NEXT ACTION:** Use 'update_step' to record findings from this tool result. Even if the tool results are not satisfactory, write down what us your finding from them.")
 
-        reminder += f"\n🔄 **STEP STATUS:** {current_status.upper()}"
+        parts.append(f"\n🔄 **STEP STATUS:** {current_status.upper()}")
 
         if current_status == "in_progress":
-            reminder += f"\n✅ **TIP:** If this completes Step {current_index + 1}, mark status as 'completed' in update_step"
+            parts.append(f"\n✅ **TIP:** If this completes Step {current_index + 1}, mark status as 'completed' in update_step")
 
-        reminder += "]"
-        reminder += "remember to explicitly explain to user what tool u used and what you found out NOW user does not see and you need to document to her what you are doing!"
-        return reminder
+        parts.append("]")
+        parts.append("remember to explicitly explain to user what tool u used and what you found out NOW user does not see and you need to document to her what you are doing!")
+        return "".join(parts)
 
     except json.JSONDecodeError:
         return "[Internal planning note: **REMEMBER** to update your progress using 'update_step' tool.]"
@@ -20,32 +20,64 @@ from tools.web_tools_ import (
 from openai import AsyncOpenAI
 from dotenv import load_dotenv
 from utils.helpers import get_endpoint
+from pathlib import Path
+import hashlib
 import os
 
 load_dotenv()
 
-_openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY", ""), timeout=300)
-_litellm_client = AsyncOpenAI(
-    base_url=os.getenv("LITELLM_BASE_URL"),
-    api_key=os.getenv("LITELLM_API_KEY", ""),
-    timeout=300,
-)
-
+_DEFAULT_EMBED_MODEL = "text-embedding-3-small"
 _EMBED_MODELS = {
     "LiteLLM": "azure.text-embedding-3-large",
-    "Anthropic": "text-embedding-3-small",
+    "Anthropic": _DEFAULT_EMBED_MODEL,
 }
+# Output dimension per embedding model
+_EMBED_DIMS = {
+    "azure.text-embedding-3-large": 3072,
+    "text-embedding-3-small": 1536,
+}
+
+# Embedding clients, built on first search rather than at import
+_openai_client = None
+_litellm_client = None
+
 
 def _get_embed_client() -> AsyncOpenAI:
-    return _litellm_client if get_endpoint() == "LiteLLM" else _openai_client
+    global _openai_client, _litellm_client
+    if get_endpoint() == "LiteLLM":
+        if _litellm_client is None:
+            _litellm_client = AsyncOpenAI(
+                base_url=os.getenv("LITELLM_BASE_URL"),
+                api_key=os.getenv("LITELLM_API_KEY", ""),
+                timeout=300,
+            )
+        return _litellm_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY", ""), timeout=300)
+    return _openai_client
+
 
 def _get_embed_model() -> str:
-    return _EMBED_MODELS.get(get_endpoint(), "text-embedding-3-small")
+    return _EMBED_MODELS.get(get_endpoint(), _DEFAULT_EMBED_MODEL)
 
-# tool_name -> {func, schema, search_text, embedding (lazily computed)}
+# tool_name -> {func, schema, search_text}
 TOOL_CATALOG = {}
 _embeddings_computed = False
 
+# Embeddings in SoA layout (computed lazily): one (n, dim) matrix per catalog,
+# rows unit-normalized and aligned with the parallel name lists
+_TOOL_NAMES: list[str] = []
+_TOOL_EMB = None
+_MCP_NAMES: list[str] = []
+_MCP_EMB = None
+
+# Embedding matrices persisted across restarts, keyed by model + search texts
+_EMB_CACHE_DIR = Path.home() / ".micro-cc" / "embeddings"
+
+# (model, query) -> unit-norm query embedding; LRU order, oldest first
+_QUERY_CACHE: dict[tuple[str, str], np.ndarray] = {}
+_QUERY_CACHE_MAX = 512
+
 
 def _register(func, search_text: str):
     """Register a tool in the catalog at module load time"""
@@ -54,7 +86,6 @@ def _register(func, search_text: str):
         "func": func,
         "schema": function_to_schema(func),
         "search_text": f"{name} {search_text}",
-        "embedding": None,  # Computed lazily on first search
     }
 
 
@@ -111,7 +142,6 @@ MCP_CATALOG = {  # Now works for both Anthropic (server-side) and LiteLLM (clien
         },
         "toolset": {"type": "mcp_toolset", "mcp_server_name": "manifold"},
         "search_text": "prediction markets forecasting sentiment trends betting odds probability",
-        "embedding": None,
     },
     "deepwiki": {
         "server": {
@@ -121,14 +151,13 @@ MCP_CATALOG = {  # Now works for both Anthropic (server-side) and LiteLLM (clien
         },
         "toolset": {"type": "mcp_toolset", "mcp_server_name": "deepwiki"},
         "search_text": "github repository documentation wiki architecture explanation codebase understanding",
-        "embedding": None,
     },
 }
 
 
 async def _ensure_embeddings():
     """Lazily compute tool embeddings on first search"""
-    global _embeddings_computed
+    global _embeddings_computed, _TOOL_NAMES, _TOOL_EMB, _MCP_NAMES, _MCP_EMB
     if _embeddings_computed:
         return
 
@@ -145,21 +174,59 @@ async def _ensure_embeddings():
         _embeddings_computed = True
         return
 
-    response = await client.embeddings.create(
-        input=search_texts, model=_get_embed_model()
-    )
-
-    # Store embeddings back - tools first, then MCPs
-    for i, name in enumerate(tool_names):
-        TOOL_CATALOG[name]["embedding"] = np.array(response.data[i].embedding)
+    model = _get_embed_model()
+    key = hashlib.sha256("\0".join(["unit", model, *search_texts]).encode()).hexdigest()[:16]
+    cache_path = _EMB_CACHE_DIR / f"tool_embeddings_{key}.npy"
+
+    # Reuse the persisted matrix (memory-mapped, read-only) when texts are unchanged
+    try:
+        emb = np.load(cache_path, mmap_mode="r")
+    except (OSError, ValueError):
+        emb = None
+    dim = _EMBED_DIMS.get(model)
+    if (
+        emb is None
+        or emb.dtype != np.float32
+        or emb.shape[0] != len(search_texts)
+        or (dim and emb.shape[1] != dim)
+    ):
+        response = await client.embeddings.create(input=search_texts, model=model)
+
+        # Stack into one contiguous matrix - tools first, then MCPs
+        emb = np.array([d.embedding for d in response.data], dtype=np.float32)
+        # Unit rows once here, so cosine scoring is a plain dot product
+        emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+        try:
+            _EMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            np.save(cache_path, emb)
+        except OSError:
+            pass
 
     offset = len(tool_names)
-    for i, name in enumerate(mcp_names):
-        MCP_CATALOG[name]["embedding"] = np.array(response.data[offset + i].embedding)
+
+    _TOOL_NAMES, _TOOL_EMB = tool_names, emb[:offset]
+    _MCP_NAMES, _MCP_EMB = mcp_names, emb[offset:]
 
     _embeddings_computed = True
 
 
+def _top_matches(names, emb, query_emb, k):
+    """Cosine-score every row in one matmul; return [(name, score)] best first.
+
+    emb rows and query_emb must already be unit-norm.
+    """
+    if emb is None or not len(names):
+        return []
+    scores = emb @ query_emb
+    # Partial selection of the top k, then sort just those
+    if k < len(scores):
+        top = np.argpartition(-scores, k)[:k]
+    else:
+        top = np.arange(len(scores))
+    order = top[np.argsort(-scores[top])]
+    return [(names[i], float(scores[i])) for i in order]
+
+
 async def search_tools(
     query: str,
     *,
@@ -176,46 +243,28 @@ async def search_tools(
     # Ensure tool embeddings are computed (only once)
     await _ensure_embeddings()
 
-    # Embed the query
-    query_resp = await client.embeddings.create(
-        input=query, model=_get_embed_model()
-    )
-    query_emb = np.array(query_resp.data[0].embedding)
-
-    # Score all tools by cosine similarity
-    scores = []
-    for name, data in TOOL_CATALOG.items():
-        tool_emb = data["embedding"]
-        if tool_emb is None:
-            continue
-        score = np.dot(query_emb, tool_emb) / (
-            np.linalg.norm(query_emb) * np.linalg.norm(tool_emb)
-        )
-        scores.append((name, float(score), data["schema"]["description"][:80]))
-
-    scores.sort(key=lambda x: x[1], reverse=True)
-    matches = [(n, d) for n, s, d in scores[:5] if s > 0.3]
-
-    # Score all MCPs
-    mcp_scores = []
-    for name, data in MCP_CATALOG.items():
-        mcp_emb = data["embedding"]
-        if mcp_emb is None:
-            continue
-        score = np.dot(query_emb, mcp_emb) / (
-            np.linalg.norm(query_emb) * np.linalg.norm(mcp_emb)
-        )
-        mcp_scores.append((name, float(score), data["search_text"][:80]))
-
-    mcp_scores.sort(key=lambda x: x[1], reverse=True)
-    mcp_matches = [(n, d) for n, s, d in mcp_scores[:3] if s > 0.3]
+    # Embed the query (repeat queries hit the cache, skipping the API call)
+    model = _get_embed_model()
+    # A hit is popped and reinserted so it moves to the most-recent end
+    query_emb = _QUERY_CACHE.pop((model, query), None)
+    if query_emb is None:
+        query_resp = await client.embeddings.create(input=query, model=model)
+        query_emb = np.array(query_resp.data[0].embedding, dtype=np.float32)
+        query_emb /= np.linalg.norm(query_emb)
+        if len(_QUERY_CACHE) >= _QUERY_CACHE_MAX:
+            del _QUERY_CACHE[next(iter(_QUERY_CACHE))]
+    _QUERY_CACHE[(model, query)] = query_emb
+
+    # Score all tools / MCPs by cosine similarity
+    matches = [n for n, s in _top_matches(_TOOL_NAMES, _TOOL_EMB, query_emb, 5) if s > 0.3]
+    mcp_matches = [n for n, s in _top_matches(_MCP_NAMES, _MCP_EMB, query_emb, 3) if s > 0.3]
 
     if not matches and not mcp_matches:
         return "No matching tools found."
 
     return {
-        "discovered_tools": [n for n, _ in matches],
-        "discovered_mcps": [n for n, _ in mcp_matches],
+        "discovered_tools": matches,
+        "discovered_mcps": mcp_matches,
     }
 
 
@@ -5,8 +5,11 @@ from skills.skill_loader import (
     get_skill_path,
     list_skill_files,
     get_available_skills,
+    skills_generation,
 )
 from pathlib import Path
+import functools
+import os
 
 
 def read_skill(skill_name: str, *, project_dir) -> str:
@@ -25,13 +28,7 @@ def read_skill(skill_name: str, *, project_dir) -> str:
     content = get_skill_content(skill_name)
 
     if not content:
-        available = get_available_skills()
-        skill_names = [s["name"] for s in available]
-        return f"Skill '{skill_name}' not found. Available: {', '.join(skill_names)}"
-
-    skill_path = get_skill_path(skill_name)
-    files = list_skill_files(skill_name)
-    md_files = [f for f in files if f.endswith(".md") and f != "SKILL.md"]
+        return f"Skill '{skill_name}' not found. Available: {_available_names(skills_generation())}"
 
     response_parts = [
         f"# Skill: {skill_name}",
@@ -39,15 +36,31 @@ def read_skill(skill_name: str, *, project_dir) -> str:
         content,
         "",
         "---",
-        f"**Skill location**: {skill_path}",
+        _skill_footer(skill_name, skills_generation()),
     ]
 
+    return "\n".join(response_parts)
+
+
+# Keyed on skills_generation() so reload_skills invalidates them
+@functools.lru_cache(maxsize=64)
+def _skill_footer(skill_name: str, generation: int) -> str:
+    """Skill location plus related .md docs, built once per skill."""
+    skill_path = get_skill_path(skill_name)
+    md_files = [f for f in list_skill_files(skill_name) if f.endswith(".md") and f != "SKILL.md"]
+
+    lines = [f"**Skill location**: {skill_path}"]
     if md_files:
-        response_parts.append("**Related documentation** (use read_skill to load):")
+        lines.append("**Related documentation** (use read_skill to load):")
         for f in md_files:
-            response_parts.append(f"  - {skill_name}/{f}")
+            lines.append(f"  - {skill_name}/{f}")
+    return "\n".join(lines)
 
-    return "\n".join(response_parts)
+
+@functools.lru_cache(maxsize=1)
+def _available_names(generation: int) -> str:
+    """Comma-joined skill names for not-found messages."""
+    return ", ".join(s["name"] for s in get_available_skills())
 
 
 def _read_subskill(skill_path: str) -> str:
@@ -62,20 +75,40 @@ def _read_subskill(skill_path: str) -> str:
 
     base_path = get_skill_path(base_skill)
     if not base_path:
-        available = get_available_skills()
-        skill_names = [s["name"] for s in available]
-        return f"Skill '{base_skill}' not found. Available: {', '.join(skill_names)}"
-
-    full_path = Path(base_path) / subfile
-    if not full_path.exists():
-        files = list_skill_files(base_skill)
-        md_files = [f for f in files if f.endswith(".md")]
+        return f"Skill '{base_skill}' not found. Available: {_available_names(skills_generation())}"
+
+    try:
+        content = _subskill_text(base_path, subfile)
+    except OSError:
+        md_files = [f for f in list_skill_files(base_skill) if f.endswith(".md")]
         return f"Subskill '{subfile}' not found in {base_skill}. Available: {', '.join(md_files)}"
 
-    content = full_path.read_text(encoding="utf-8")
     return f"# {base_skill}/{subfile}\n\n{content}"
 
 
+# subskill path -> (mtime_ns, content)
+_subskill_cache: dict[str, tuple[int, str]] = {}
+
+
+def _subskill_text(base_path: str, subfile: str) -> str:
+    """Subskill file content; re-read only when the file's mtime changes.
+
+    Raises OSError (FileNotFoundError, IsADirectoryError, ...) for a missing subskill.
+    """
+    path = os.path.join(base_path, subfile)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        _subskill_cache.pop(path, None)
+        raise
+    cached = _subskill_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    content = Path(path).read_text(encoding="utf-8", errors="replace")
+    _subskill_cache[path] = (mtime, content)
+    return content
+
+
 def list_skills(*, project_dir) -> str:
     """List all available skills with their descriptions."""
     skills = get_available_skills()
@@ -1,11 +1,39 @@
 from browser.browser_manager import BrowserManager
 from dotenv import load_dotenv
-import requests
+import asyncio
+import httpx
+import importlib.util
+import weakref
 
 load_dotenv()
 
 browser_manager = BrowserManager()
 
+# Shared async HTTP client for requests that bypass the browser, created on
+# first use; HTTP/2 (multiplexed) when the optional h2 package is installed.
+# Its pool is bound to the event loop it first ran on, so one client per loop:
+# id(loop) -> (loop weakref, client)
+_http_clients: dict[int, tuple] = {}
+
+
+def _http() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    entry = _http_clients.get(id(loop))
+    if entry is None or entry[0]() is not loop:
+        # Drop clients of loops that are gone or closed (ids can be reused)
+        for k in [k for k, (ref, _) in _http_clients.items() if ref() is None or ref().is_closed()]:
+            del _http_clients[k]
+        entry = _http_clients[id(loop)] = (
+            weakref.ref(loop),
+            httpx.AsyncClient(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+                timeout=15.0,
+                headers={"User-Agent": "micro-cc/web-tools"},
+            ),
+        )
+    return entry[1]
+
 
 def google_search(query: str, filter_year: int = None, *, project_dir) -> str:
     """Search the web for information.
@@ -16,8 +44,7 @@ def google_search(query: str, filter_year: int = None, *, project_dir) -> str:
     """
     browser = browser_manager.get_browser(project_dir)
     browser.visit_page(f"google: {query}", filter_year=None)
-    header, content = browser._state()
-    return header.strip() + "\n=======================\n" + content
+    return browser.formatted_state()
 
 
 def visit_url(url: str, *, project_dir) -> str:
@@ -31,11 +58,16 @@ def visit_url(url: str, *, project_dir) -> str:
     """
     browser = browser_manager.get_browser(project_dir)
     browser.visit_page(url)
-    header, content = browser._state()
-    return header.strip() + "\n=======================\n" + content
+    return browser.formatted_state()
+
+
+async def _archive_probe(api_url: str) -> dict:
+    """archived_snapshots of one availability query."""
+    resp = await _http().get(api_url, timeout=10)
+    return resp.json().get("archived_snapshots") or {}
 
 
-def archive_search(url: str, date: str, *, project_dir) -> str:
+async def archive_search(url: str, date: str, *, project_dir) -> str:
     """Search Wayback Machine for archived version closest to date.
 
     Args:
@@ -45,30 +77,19 @@ def archive_search(url: str, date: str, *, project_dir) -> str:
     browser = browser_manager.get_browser(project_dir)
     base_api = f"https://archive.org/wayback/available?url={url}"
     archive_api = base_api + f"&timestamp={date}"
-    res_with_ts = requests.get(archive_api).json()
-    res_without_ts = requests.get(base_api).json()
-
-    if (
-        "archived_snapshots" in res_with_ts
-        and "closest" in res_with_ts["archived_snapshots"]
-    ):
-        closest = res_with_ts["archived_snapshots"]["closest"]
-    elif (
-        "archived_snapshots" in res_without_ts
-        and "closest" in res_without_ts["archived_snapshots"]
-    ):
-        closest = res_without_ts["archived_snapshots"]["closest"]
-    else:
+
+    # Timestamped probe first; the undated one is only a fallback
+    closest = (await _archive_probe(archive_api)).get("closest")
+    if not closest:
+        closest = (await _archive_probe(base_api)).get("closest")
+    if not closest:
         return f"Archive not found for {url}."
 
     target_url = closest["url"]
     browser.visit_page(target_url)
-    header, content = browser._state()
     return (
         f"web archive for url {url}, snapshot on {closest['timestamp'][:8]}:\n"
-        + header.strip()
-        + "\n=======================\n"
-        + content
+        + browser.formatted_state()
     )
 
 
@@ -76,16 +97,14 @@ def page_up(project_dir) -> str:
     """Scroll up one page."""
     browser = browser_manager.get_browser(project_dir)
     browser.page_up()
-    header, content = browser._state()
-    return header.strip() + "\n=======================\n" + content
+    return browser.formatted_state()
 
 
 def page_down(project_dir) -> str:
     """Scroll down one page."""
     browser = browser_manager.get_browser(project_dir)
     browser.page_down()
-    header, content = browser._state()
-    return header.strip() + "\n=======================\n" + content
+    return browser.formatted_state()
 
 
 def find_on_page(search_string: str, *, project_dir) -> str:
@@ -96,24 +115,22 @@ def find_on_page(search_string: str, *, project_dir) -> str:
     """
     browser = browser_manager.get_browser(project_dir)
     result = browser.find_on_page(search_string)
-    header, content = browser._state()
-
     if result is None:
+        header, _ = browser._state()
         return header.strip() + f"\n=======================\nThe search string '{search_string}' was not found on this page."
 
-    return header.strip() + "\n=======================\n" + content
+    return browser.formatted_state()
 
 
 def find_next(project_dir) -> str:
     """Find next occurrence of previous search."""
     browser = browser_manager.get_browser(project_dir)
     result = browser.find_next()
-    header, content = browser._state()
-
     if result is None:
+        header, _ = browser._state()
         return header.strip() + "\n=======================\nNo further occurrences found."
 
-    return header.strip() + "\n=======================\n" + content
+    return browser.formatted_state()
 
 
 def download_from_url(url: str, *, project_dir) -> str:
@@ -124,8 +141,7 @@ def download_from_url(url: str, *, project_dir) -> str:
     """
     browser = browser_manager.get_browser(project_dir)
     browser.visit_page(url)
-    header, content = browser._state()
-    return header.strip() + "\n=======================\n" + content
+    return browser.formatted_state()
 
 
 def text_file(filename: str, *, project_dir) -> str:
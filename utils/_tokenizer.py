@@ -0,0 +1,11 @@
+# Shared cl100k_base encoding; the BPE table is loaded on first use only
+_enc = None
+
+
+def get_tokenizer():
+    global _enc
+    if _enc is None:
+        import tiktoken
+
+        _enc = tiktoken.get_encoding("cl100k_base")
+    return _enc
@@ -1,8 +1,28 @@
 import os
+
+# project_dir -> (mtime_ns, content)
+_claude_md_cache: dict[str, tuple[int, str]] = {}
+
+
 def load_claude_md_file(project_dir: str) -> str:
-    """Load CLAUDE.md from project directory if it exists."""
+    """Load CLAUDE.md from project directory if it exists.
+
+    Cached per project_dir; re-read only when the file's mtime changes.
+    """
     claude_md_path = os.path.join(project_dir, "CLAUDE.md")
-    if os.path.exists(claude_md_path):
-        with open(claude_md_path, "r") as f:
-            return f.read()
-    return ""
+    try:
+        mtime = os.stat(claude_md_path).st_mtime_ns
+    except FileNotFoundError:
+        _claude_md_cache.pop(project_dir, None)
+        return ""
+    cached = _claude_md_cache.get(project_dir)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(claude_md_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except FileNotFoundError:  # removed between stat and open
+        _claude_md_cache.pop(project_dir, None)
+        return ""
+    _claude_md_cache[project_dir] = (mtime, content)
+    return content
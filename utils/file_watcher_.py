@@ -4,28 +4,29 @@ Uses watchdog to monitor file changes and buffers them for injection into contex
 """
 
 import os
+import re
 import threading
-from pathlib import Path
+import time
+from collections import deque
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
-# Patterns to ignore
-IGNORE_PATTERNS = {
-    '.git', '__pycache__', '.pyc', '.pyo', '.swp', '.swo',
-    '.DS_Store', 'node_modules', '.env', '.venv', 'env', 'venv',
-    '.idea', '.vscode', '*.log', '.micro-cc'
-}
+# Paths to ignore, as one compiled scan: any of these directory/file names
+# as a whole path component, or a file ending in one of the extensions
+_IGNORE_RE = re.compile(
+    r'(?:^|[\\/])'
+    r'(?:\.git|__pycache__|node_modules|\.venv|\.env|venv|env|\.idea|\.vscode|\.micro-cc|\.DS_Store)'
+    r'(?:[\\/]|$)'
+    r'|\.(?:pyc|pyo|swp|swo|log)$'
+)
+
+# Events are merged into ChangeHandler.changes every N events or T seconds
+_FLUSH_EVERY = 64
+_FLUSH_INTERVAL = 0.05
 
 def should_ignore(path: str) -> bool:
     """Check if path should be ignored."""
-    parts = Path(path).parts
-    for part in parts:
-        if part in IGNORE_PATTERNS:
-            return True
-        for pattern in IGNORE_PATTERNS:
-            if pattern.startswith('*') and part.endswith(pattern[1:]):
-                return True
-    return False
+    return _IGNORE_RE.search(path) is not None
 
 
 class ChangeHandler(FileSystemEventHandler):
@@ -33,8 +34,11 @@ class ChangeHandler(FileSystemEventHandler):
 
     def __init__(self, project_dir: str):
         self.project_dir = project_dir
-        self.changes = []  # list of (event_type, relative_path)
+        self.changes = {}  # (event_type, relative_path) -> None; ordered set
         self._lock = threading.Lock()
+        # Lock-free staging for the watchdog thread; deque append/popleft are thread-safe
+        self._pending = deque()
+        self._last_flush = time.monotonic()
 
     def _record(self, event_type: str, path: str):
         if should_ignore(path):
@@ -45,11 +49,19 @@ class ChangeHandler(FileSystemEventHandler):
         except ValueError:
             rel_path = path
 
-        with self._lock:
-            # Dedupe: don't add same file+event twice
-            entry = (event_type, rel_path)
-            if entry not in self.changes:
-                self.changes.append(entry)
+        self._pending.append((event_type, rel_path))
+        now = time.monotonic()
+        if len(self._pending) >= _FLUSH_EVERY or now - self._last_flush > _FLUSH_INTERVAL:
+            with self._lock:
+                self._flush_locked()
+            self._last_flush = now
+
+    def _flush_locked(self):
+        """Move staged events into changes; caller holds _lock."""
+        pending, changes = self._pending, self.changes
+        while pending:
+            # Dedupe: same file+event is kept once, in first-seen order
+            changes[pending.popleft()] = None
 
     def on_modified(self, event):
         if not event.is_directory:
@@ -70,7 +82,8 @@ class ChangeHandler(FileSystemEventHandler):
     def drain(self) -> list:
         """Get and clear all buffered changes."""
         with self._lock:
-            changes = self.changes.copy()
+            self._flush_locked()
+            changes = list(self.changes)
             self.changes.clear()
             return changes
 
@@ -102,7 +115,8 @@ class FileWatcher:
     def get_changes(self) -> list:
         """Get buffered changes without clearing."""
         with self.handler._lock:
-            return self.handler.changes.copy()
+            self.handler._flush_locked()
+            return list(self.handler.changes)
 
     def drain_changes(self) -> list:
         """Get and clear buffered changes."""
@@ -1,10 +1,10 @@
 from dotenv import load_dotenv
-from PIL import Image
-import tiktoken
+from utils._tokenizer import get_tokenizer
 import base64
 import json
 import os
 import io
+import re
 
 load_dotenv(os.path.expanduser("~/.micro-cc/.env"))
 load_dotenv()
@@ -21,7 +21,14 @@ def get_endpoint() -> str:
 ############################################################################################################
 ##tokenizer
 
-tokenizer = tiktoken.get_encoding("cl100k_base")
+# `tokenizer` is resolved lazily (PEP 562) so importing helpers doesn't load
+# tiktoken's BPE table; `from utils.helpers import tokenizer` still works
+
+
+def __getattr__(name):
+    if name == "tokenizer":
+        return get_tokenizer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 ############################################################################################################
 ##dirs
@@ -31,20 +38,35 @@ WORK_FOLDER = os.path.join(os.getcwd(), "workspace/")
 ############################################################################################################
 
 
+# JPEGs up to this size are sent as-is (base64 stays under the 5MB API cap)
+_JPEG_MAGIC = b"\xff\xd8\xff"
+_JPEG_PASSTHROUGH_MAX = 3 * 1024 * 1024
+
+
 def sanitize_and_encode_image_(img_data):
     try:
         if isinstance(img_data, str) and os.path.exists(img_data):
-            with Image.open(img_data) as img:
-                img = img.convert("RGB")
-                buffer = io.BytesIO()
-                img.save(buffer, format="JPEG")
-                return base64.b64encode(buffer.getvalue()).decode("utf-8")
-        else:
-            with Image.open(io.BytesIO(img_data)) as img:
-                img = img.convert("RGB")
-                buffer = io.BytesIO()
-                img.save(buffer, format="JPEG")
-                return base64.b64encode(buffer.getvalue()).decode("utf-8")
+            with open(img_data, "rb") as f:
+                img_data = f.read()
+
+        from PIL import Image
+
+        # Image.open parses only the header; pixels are decoded by convert()
+        with Image.open(io.BytesIO(img_data)) as img:
+            # Already a small RGB/grayscale JPEG: skip the decode / re-encode round trip
+            if (
+                img_data[:3] == _JPEG_MAGIC
+                and len(img_data) <= _JPEG_PASSTHROUGH_MAX
+                and img.format == "JPEG"
+                and img.mode in ("RGB", "L")
+            ):
+                return base64.b64encode(img_data).decode("ascii")
+
+            img = img.convert("RGB")
+            buffer = io.BytesIO()
+            img.save(buffer, format="JPEG")
+            # getbuffer() is a zero-copy view; base64 output is pure ASCII
+            return base64.b64encode(buffer.getbuffer()).decode("ascii")
     except Exception as e:
         print(f"Image encoding error: {e}")
         return None
@@ -53,32 +75,33 @@ def sanitize_and_encode_image_(img_data):
 ###################################################################################################################
 
 
+# Braces only; the scan jumps between them in C instead of stepping per char
+_BRACE_RE = re.compile(r"[{}]")
+
+
 def extract_json_robust(text):
     """util to extract jsons"""
     results = []
-    i = 0
-    while i < len(text):
-        if text[i] == "{":
-            bracket_count = 1
-            start = i
-            i += 1
-
-            while i < len(text) and bracket_count > 0:
-                if text[i] == "{":
-                    bracket_count += 1
-                elif text[i] == "}":
-                    bracket_count -= 1
-                i += 1
-
-            if bracket_count == 0:
-                json_candidate = text[start:i]
-                try:
-                    parsed = json.loads(json_candidate)
-                    results.append(parsed)
-                except:
-                    pass
-        else:
-            i += 1
+    start = text.find("{")
+    while start >= 0:
+        depth = 0
+        end = -1
+        for m in _BRACE_RE.finditer(text, start):
+            if m.group() == "{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    end = m.end()
+                    break
+        if end < 0:
+            break  # unbalanced to the end of text
+
+        try:
+            results.append(json.loads(text[start:end]))
+        except:
+            pass
+        start = text.find("{", end)
     return results
 
 
@@ -1,9 +1,25 @@
 import datetime
+import functools
 import hashlib
 import json
 import os
 from pathlib import Path
-from utils.helpers import tokenizer
+from typing import Optional
+from utils._tokenizer import get_tokenizer
+
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps_line(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_line(obj) -> bytes:
+        return (json.dumps(obj) + "\n").encode()
 
 
 MAX_MSGS_BEFORE_SUMMARY = 10
@@ -11,7 +27,13 @@ MAX_SUMMARY_INPUT_TOKENS = 10000
 
 
 def _get_storage_dir(project_dir: str) -> Path:
-    """Get CC-style storage path: ~/.micro-cc/projects/{project_hash}/
+    """Get CC-style storage path: ~/.micro-cc/projects/{project_hash}/"""
+    return _resolve_storage_dir(project_dir)
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_storage_dir(project_dir: str) -> Path:
+    """Hash, mkdir and write the path mapping once per project_dir.
 
     Hash ensures valid folder name regardless of project path characters.
     """
@@ -35,19 +57,67 @@ def _get_storage_dir(project_dir: str) -> Path:
     return storage_dir
 
 
+# messages.jsonl path -> (messages in it, its size in bytes) as last written
+# or loaded by this process; only a file in exactly that state is appended to
+_persisted: dict[Path, tuple[int, int]] = {}
+
+
+def _parse_lines(data: bytes) -> tuple[list, bool]:
+    """Parse JSONL bytes into messages; clean is False if a line is malformed
+    or the last line is unterminated (e.g. a write cut short by a crash)."""
+    clean = not data or data.endswith(b"\n")
+    msgs = []
+    # One bulk read split in C; surrounding whitespace is fine for the parser
+    for line in data.split(b"\n"):
+        if line.strip():
+            try:
+                msgs.append(_reconstruct_message(_loads(line)))
+            except json.JSONDecodeError:
+                clean = False  # Skip malformed lines
+    return msgs, clean
+
+
+def _disk_state(path: Path) -> Optional[tuple[int, int]]:
+    """(message count, size) of a clean file on disk, else None."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return (0, 0)
+    msgs, clean = _parse_lines(data)
+    return (len(msgs), len(data)) if clean else None
+
+
 def store_msgs(project_dir: str, msgs: list) -> None:
     """Append messages to JSONL file for project.
 
-    Overwrites file with all messages (full state save).
-    Each line is one message JSON object.
+    msgs is the full conversation; only messages past those already on disk
+    are serialized and appended. Each line is one message JSON object. The
+    file is rewritten in full when it isn't in the state this process last
+    left it in (partial last line, malformed lines, external change).
     """
     storage_dir = _get_storage_dir(project_dir)
     jsonl_path = storage_dir / "messages.jsonl"
 
-    with open(jsonl_path, "w") as f:
-        for msg in msgs:
-            normalized = _normalize_message(msg)
-            f.write(json.dumps(normalized) + "\n")
+    try:
+        size = os.path.getsize(jsonl_path)
+    except FileNotFoundError:
+        size = 0
+    state = _persisted.get(jsonl_path)
+    if state is None or state[1] != size:
+        state = _disk_state(jsonl_path)
+
+    # Unclean file or history shrank (new conversation) - rewrite from scratch
+    mode, persisted = "a", 0 if state is None else state[0]
+    if state is None or len(msgs) < persisted:
+        mode, persisted = "w", 0
+
+    _persisted.pop(jsonl_path, None)  # unknown until the write completes
+    with open(jsonl_path, mode + "b") as f:
+        for msg in msgs[persisted:]:
+            f.write(_dumps_line(_normalize_message(msg)))
+        size = f.tell()
+
+    _persisted[jsonl_path] = (len(msgs), size)
 
 
 def load_msgs(project_dir: str) -> list:
@@ -55,20 +125,19 @@ def load_msgs(project_dir: str) -> list:
     storage_dir = _get_storage_dir(project_dir)
     jsonl_path = storage_dir / "messages.jsonl"
 
-    if not jsonl_path.exists():
+    try:
+        data = jsonl_path.read_bytes()
+    except FileNotFoundError:
+        _persisted[jsonl_path] = (0, 0)
         return []
 
-    msgs = []
-    with open(jsonl_path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                try:
-                    normalized = json.loads(line)
-                    msgs.append(_reconstruct_message(normalized))
-                except json.JSONDecodeError:
-                    continue  # Skip malformed lines
+    msgs, clean = _parse_lines(data)
 
+    # An unclean file gets rewritten from msgs on the next store
+    if clean:
+        _persisted[jsonl_path] = (len(msgs), len(data))
+    else:
+        _persisted.pop(jsonl_path, None)
     return msgs
 
 
@@ -79,23 +148,28 @@ def erase_msgs(project_dir: str) -> None:
 
     if jsonl_path.exists():
         jsonl_path.unlink()
+    _persisted[jsonl_path] = (0, 0)
 
 
 def _normalize_message(msg: dict) -> dict:
     """Convert message to serializable dict - strips thinking blocks (API rejects them)."""
+    content = msg.get("content")
+
+    # Simple string content - already serializable, nothing to walk
+    if isinstance(content, str):
+        return {
+            "role": msg.get("role"),
+            "ts": datetime.datetime.now().isoformat(),
+            "content": content,
+        }
+
     normalized = {
         "role": msg.get("role"),
         "ts": datetime.datetime.now().isoformat(),
     }
 
-    content = msg.get("content")
-
-    # Simple string content
-    if isinstance(content, str):
-        normalized["content"] = content
-
     # List content - preserve structure for API (NO thinking blocks)
-    elif isinstance(content, list):
+    if isinstance(content, list):
         normalized["content"] = []
         for item in content:
             # Anthropic SDK objects - convert to dict
@@ -189,7 +263,7 @@ def _extract_excess_text(msgs: list) -> str:
             continue
 
         line = f"{role}: {content}"
-        line_tokens = len(tokenizer.encode(line))
+        line_tokens = len(get_tokenizer().encode(line))
         if total_tokens + line_tokens > MAX_SUMMARY_INPUT_TOKENS:
             break
 
@@ -236,6 +310,7 @@ async def _call_haiku_summary(prev_summary: str, messages_text: str) -> str:
         if resp and resp.content:
             summary = resp.content[0].text
             # Hard cap: truncate if Haiku exceeded token limit
+            tokenizer = get_tokenizer()
             tokens = tokenizer.encode(summary)
             if len(tokens) > 2000:
                 summary = tokenizer.decode(tokens[:2000])
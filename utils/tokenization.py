@@ -1,5 +1,4 @@
 import json
-from utils.helpers import tokenizer
 
 
 def token_cutter(messages: list[dict], tokenizer, max_tokens: int) -> list[dict]:
@@ -1,7 +1,9 @@
 import json
 
 
-def token_cutter(messages: list[dict], tokenizer, max_tokens: int) -> list[dict]:
+def token_cutter(
+    messages: list[dict], tokenizer, max_tokens: int, token_cache: dict | None = None
+) -> list[dict]:
     """
     Context window management via atomic chunk dropping.
 
@@ -14,15 +16,38 @@ def token_cutter(messages: list[dict], tokenizer, max_tokens: int) -> list[dict]
     2. Last real user message (not tool_result/system-reminder) always kept
     3. Tool cycles dropped as atomic units — no orphaned tool_use/tool_result
     4. Oldest chunks dropped first until under budget
+
+    token_cache maps id(msg) -> token count. Pass the same dict across calls
+    over a growing (append-only) history so each message is encoded once.
     """
     if not messages:
         return messages
 
+    cache = token_cache if token_cache is not None else {}
+
     def count_tokens(msg):
-        content = msg.get("content")
-        if isinstance(content, (dict, list)):
-            content = json.dumps(content)
-        return len(tokenizer.encode(content or ""))
+        n = cache.get(id(msg))
+        if n is None:
+            content = msg.get("content")
+            if isinstance(content, (dict, list)):
+                content = json.dumps(content)
+            n = cache[id(msg)] = len(tokenizer.encode(content or ""))
+        return n
+
+    # Cheap pre-check without tokenizing: a token covers at least one UTF-8
+    # byte, so byte length is an upper bound on token count
+    upper = 0
+    for m in messages:
+        n = cache.get(id(m))
+        if n is None:
+            content = m.get("content") or ""
+            if isinstance(content, (dict, list)):
+                n = len(json.dumps(content))  # ensure_ascii: chars == bytes
+            else:
+                n = len(content) if content.isascii() else 4 * len(content)
+        upper += n
+    if upper <= max_tokens:
+        return messages
 
     total = sum(count_tokens(m) for m in messages)
     if total <= max_tokens:
@@ -1,10 +1,17 @@
-import tiktoken
 import json
 import os
+import re
+from utils._tokenizer import get_tokenizer
 
 #############################################
 
-tokenizer = tiktoken.get_encoding("cl100k_base")
+
+def __getattr__(name):
+    # utils.utils.tokenizer resolves to the shared encoding, loaded on first access
+    if name == "tokenizer":
+        return get_tokenizer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 ############################################
 
@@ -13,33 +20,35 @@ WORK_FOLDER = os.path.join(os.getcwd(), "workspace/")
 ###########################################
 
 
+# Candidate openers, and per-opener bracket pairs for the balance scan
+_OPEN_RE = re.compile(r"[{\[]")
+_PAIR_RE = {"{": re.compile(r"[{}]"), "[": re.compile(r"[\[\]]")}
+
+
 def extract_json_(text):
     """Extract first valid JSON (object or array) from text and return as parsed object"""
-    i = 0
-    while i < len(text):
-        if text[i] in ["{", "["]:
-            open_char = text[i]
-            close_char = "}" if open_char == "{" else "]"
-            bracket_count = 1
-            start = i
-            i += 1
-
-            while i < len(text) and bracket_count > 0:
-                if text[i] == open_char:
-                    bracket_count += 1
-                elif text[i] == close_char:
-                    bracket_count -= 1
-                i += 1
-
-            if bracket_count == 0:
-                json_candidate = text[start:i]
-                try:
-                    parsed = json.loads(json_candidate)
-                    return parsed  # Return parsed object/array
-                except:
-                    pass
-        else:
-            i += 1
+    opener = _OPEN_RE.search(text)
+    while opener:
+        start = opener.start()
+        open_char = text[start]
+        depth = 0
+        end = -1
+        for m in _PAIR_RE[open_char].finditer(text, start):
+            if m.group() == open_char:
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    end = m.end()
+                    break
+        if end < 0:
+            break  # unbalanced to the end of text
+
+        try:
+            return json.loads(text[start:end])  # Return parsed object/array
+        except:
+            pass
+        opener = _OPEN_RE.search(text, end)
     return {}  # Return empty dict, not string
 
 